@@ -0,0 +1,26 @@
+"""Add claimed_until to outbox_message
+
+Revision ID: 2b6d9f3a7c45
+Revises: 9e4b2f7c1d58
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b6d9f3a7c45'
+down_revision: Union[str, None] = '9e4b2f7c1d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox_message', sa.Column('claimed_until', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('outbox_message', 'claimed_until')
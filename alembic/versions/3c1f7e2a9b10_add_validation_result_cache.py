@@ -0,0 +1,33 @@
+"""Add validation result cache
+
+Revision ID: 3c1f7e2a9b10
+Revises: a97548be1a6b
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7e2a9b10'
+down_revision: Union[str, None] = 'a97548be1a6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('validation_result_cache',
+    sa.Column('key', sa.String(length=160), nullable=False),
+    sa.Column('result', sa.LargeBinary(), nullable=False),
+    sa.Column('created_time', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_validation_result_cache_created_time'), 'validation_result_cache', ['created_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_validation_result_cache_created_time'), table_name='validation_result_cache')
+    op.drop_table('validation_result_cache')
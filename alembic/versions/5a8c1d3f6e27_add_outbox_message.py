@@ -0,0 +1,38 @@
+"""Add outbox message
+
+Revision ID: 5a8c1d3f6e27
+Revises: 7d2e4b6c8a31
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8c1d3f6e27'
+down_revision: Union[str, None] = '7d2e4b6c8a31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox_message',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('trace_id', sa.String(length=64), nullable=False),
+    sa.Column('routing_key', sa.String(length=255), nullable=False),
+    sa.Column('body', sa.LargeBinary(), nullable=False),
+    sa.Column('created_time', sa.DateTime(), nullable=False),
+    sa.Column('sent_time', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_outbox_message_created_time'), 'outbox_message', ['created_time'], unique=False)
+    op.create_index(op.f('ix_outbox_message_sent_time'), 'outbox_message', ['sent_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_outbox_message_sent_time'), table_name='outbox_message')
+    op.drop_index(op.f('ix_outbox_message_created_time'), table_name='outbox_message')
+    op.drop_table('outbox_message')
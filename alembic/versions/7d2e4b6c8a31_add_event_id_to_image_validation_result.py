@@ -0,0 +1,29 @@
+"""Add event_id to image_validation_result
+
+Revision ID: 7d2e4b6c8a31
+Revises: 3c1f7e2a9b10
+Create Date: 2026-10-18 09:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4b6c8a31'
+down_revision: Union[str, None] = '3c1f7e2a9b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 행은 event_id 가 없으므로 nullable (유니크 인덱스에서 NULL 은 서로 겹치지 않는다)
+    op.add_column('image_validation_result', sa.Column('event_id', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_image_validation_result_event_id'), 'image_validation_result', ['event_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_image_validation_result_event_id'), table_name='image_validation_result')
+    op.drop_column('image_validation_result', 'event_id')
@@ -0,0 +1,107 @@
+"""Partition image_validation_result and add lookup indexes
+
+Revision ID: 9e4b2f7c1d58
+Revises: 5a8c1d3f6e27
+Create Date: 2026-10-18 09:40:00.000000
+
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b2f7c1d58'
+down_revision: Union[str, None] = '5a8c1d3f6e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션 시점부터 미리 만들어 둘 월별 파티션 수 (이후는 ResultRetention 이 만든다)
+MONTHS_AHEAD = 2
+
+
+def next_month(value: datetime) -> datetime:
+    return (value.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        upgrade_postgresql()
+    else:
+        # 파티션이 없는 DB 는 created_time 인덱스로 나눠 지운다 (ResultRetention)
+        # 유니크 event_id 는 processed_event 로 옮긴다 (PostgreSQL 과 같은 방식)
+        op.drop_index(op.f('ix_image_validation_result_event_id'), table_name='image_validation_result')
+        op.create_index(op.f('ix_image_validation_result_event_id'), 'image_validation_result', ['event_id'], unique=False)
+        op.create_index(op.f('ix_image_validation_result_gid'), 'image_validation_result', ['gid'], unique=False)
+        op.create_index(op.f('ix_image_validation_result_created_time'), 'image_validation_result', ['created_time'], unique=False)
+
+    op.create_table('processed_event',
+    sa.Column('event_id', sa.String(length=64), nullable=False),
+    sa.Column('created_time', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index(op.f('ix_processed_event_created_time'), 'processed_event', ['created_time'], unique=False)
+    op.execute(
+        "INSERT INTO processed_event (event_id, created_time) "
+        "SELECT event_id, MAX(created_time) FROM image_validation_result "
+        "WHERE event_id IS NOT NULL GROUP BY event_id"
+    )
+
+
+def upgrade_postgresql() -> None:
+    # 파티션 키 (created_time) 가 없는 유니크 인덱스는 partition 된 테이블에 만들 수 없으므로
+    # 기본 키는 (id, created_time), event_id 는 일반 인덱스로 바꾼다
+    op.drop_index(op.f('ix_image_validation_result_event_id'), table_name='image_validation_result')
+    op.execute("ALTER TABLE image_validation_result RENAME TO image_validation_result_old")
+    op.execute("ALTER INDEX image_validation_result_pkey RENAME TO image_validation_result_old_pkey")
+    op.execute(
+        "CREATE TABLE image_validation_result "
+        "(LIKE image_validation_result_old INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_time)"
+    )
+    op.execute("ALTER TABLE image_validation_result ADD PRIMARY KEY (id, created_time)")
+    op.execute("CREATE TABLE image_validation_result_default PARTITION OF image_validation_result DEFAULT")
+
+    # 기존 행의 가장 이른 달부터 MONTHS_AHEAD 개월 뒤까지 월별 파티션
+    oldest = op.get_bind().scalar(sa.text("SELECT MIN(created_time) FROM image_validation_result_old"))
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    start = (oldest or now).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    for _ in range(MONTHS_AHEAD):
+        last = next_month(last)
+    while start <= last:
+        end = next_month(start)
+        op.execute(
+            f"CREATE TABLE image_validation_result_p{start:%Y%m} PARTITION OF image_validation_result "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+
+    op.execute("INSERT INTO image_validation_result SELECT * FROM image_validation_result_old")
+    op.execute("DROP TABLE image_validation_result_old")
+
+    op.create_index(op.f('ix_image_validation_result_event_id'), 'image_validation_result', ['event_id'], unique=False)
+    op.create_index(op.f('ix_image_validation_result_gid'), 'image_validation_result', ['gid'], unique=False)
+    op.create_index(op.f('ix_image_validation_result_created_time'), 'image_validation_result', ['created_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_processed_event_created_time'), table_name='processed_event')
+    op.drop_table('processed_event')
+
+    op.drop_index(op.f('ix_image_validation_result_created_time'), table_name='image_validation_result')
+    op.drop_index(op.f('ix_image_validation_result_gid'), table_name='image_validation_result')
+    op.drop_index(op.f('ix_image_validation_result_event_id'), table_name='image_validation_result')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE image_validation_result RENAME TO image_validation_result_partitioned")
+        op.execute("ALTER INDEX image_validation_result_pkey RENAME TO image_validation_result_partitioned_pkey")
+        op.execute(
+            "CREATE TABLE image_validation_result "
+            "(LIKE image_validation_result_partitioned INCLUDING DEFAULTS)"
+        )
+        op.execute("ALTER TABLE image_validation_result ADD PRIMARY KEY (id)")
+        op.execute("INSERT INTO image_validation_result SELECT * FROM image_validation_result_partitioned")
+        op.execute("DROP TABLE image_validation_result_partitioned")
+    op.create_index(op.f('ix_image_validation_result_event_id'), 'image_validation_result', ['event_id'], unique=True)
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -30,6 +31,80 @@ class Settings(BaseSettings):
     rabbitmq_image_validation_dlx: str
     rabbitmq_image_validation_dlx_routing_key: str
 
+    # 브로커가 미리 보내주는 메시지 수와 동시에 처리하는 메시지 수는 따로 설정
+    rabbitmq_prefetch_count: int = 1
+    max_concurrent_messages: int = 1
+
+    # 요청 큐의 x-message-ttl, 메시지 마감 시각 = 헤더 timestamp + TTL - 저장/발행 여유 시간
+    rabbitmq_message_ttl_ms: int = 10000
+    deadline_margin_ms: int = 500
+    # 마감이 촉박할 때: none | skip (생략 가능한 검출기 건너뜀) | coarse (낮은 해상도로 실행, 안 되면 건너뜀)
+    degradation_policy: Literal["none", "skip", "coarse"] = "coarse"
+
+    # concurrent: 메시지 단위 처리, batch: N개 또는 T ms 동안 모아서 한 번에 처리,
+    # pipeline: 다운로드 → 디코딩 → 검증 → 저장 → 발행 단계별 워커로 처리
+    consumer_mode: Literal["concurrent", "batch", "pipeline"] = "concurrent"
+    batch_max_size: int = 32
+    batch_max_wait_ms: int = 50
+
+    # 파이프라인 단계별 워커 수 (검증 0 이면 검증 워커 수와 동일), 단계 사이 큐 크기
+    pipeline_download_workers: int = 4
+    pipeline_decode_workers: int = 2
+    pipeline_validate_workers: int = 0
+    pipeline_persist_workers: int = 2
+    pipeline_publish_workers: int = 2
+    pipeline_queue_size: int = 4
+    pipeline_stats_interval_sec: int = 30
+
+    # 검증 실행 방식: process | thread | inline, 워커 수 0 이면 CPU 코어 수
+    validation_executor: Literal["process", "thread", "inline"] = "process"
+    validation_workers: int = 0
+    # process 모드에서 이미지를 넘길 공유 메모리 슬롯 (슬롯 수 0 이면 워커 수 x 2, 크기 0 이면 사용 안 함)
+    # 슬롯 수 x 크기는 시작 시 /dev/shm 여유 공간에 맞춰 줄이고, 빈 슬롯이 없으면 pickle 로 넘긴다
+    shared_memory_slots: int = 0
+    shared_memory_slot_mb: int = 64
+
+    # 디코딩 결과 픽셀 수 상한 (JPEG 은 DCT 스케일링으로 1/2, 1/4, 1/8 축소), 0 이면 원본 해상도 컬러
+    decode_pixel_budget: int = 0
+
+    # 검증 결과 캐시: 메모리 LRU 항목 수/TTL, DB 저장 여부, 다운로드 전 HEAD 로 ETag 조회 여부
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 10000
+    result_cache_ttl_sec: int = 3600
+    result_cache_persistent: bool = False
+    result_cache_head_check: bool = True
+    # 유사 이미지의 빈 페이지 판정 재사용: dHash (64비트) 해밍 거리 상한, 색인 항목 수, 색인할 최소 밝기 표준편차
+    near_duplicate_enabled: bool = False
+    near_duplicate_max_distance: int = 3
+    near_duplicate_max_entries: int = 100_000
+    near_duplicate_min_contrast: float = 10.0
+    # 재전달 중복 처리 방지: 최근 완료한 event_id 를 기억할 개수 (메모리에 없으면 재전달 메시지만 DB 조회)
+    completed_event_cache_size: int = 10000
+    # 결과 행을 모아 한 번에 저장: 최대 행 수, 첫 행 이후 최대 대기 시간, 대기 큐 크기
+    result_writer_enabled: bool = True
+    result_writer_batch_rows: int = 100
+    result_writer_flush_interval_ms: int = 20
+    result_writer_queue_size: int = 1000
+    # 결과 메시지를 outbox 테이블에 저장하고 relay 가 모아서 발행: 묶음 크기, 확인 주기, 발행 완료 행 보관 시간,
+    # 가져간 행을 발행 확인 없이 다시 가져가기까지의 시간
+    outbox_enabled: bool = True
+    outbox_relay_batch_size: int = 100
+    outbox_relay_interval_ms: int = 1000
+    outbox_retention_sec: int = 86400
+    outbox_claim_timeout_sec: int = 60
+    # DATABASE_URL 이 postgresql+asyncpg 이면 결과 행을 binary COPY 로 저장 (false 면 INSERT)
+    postgres_copy_enabled: bool = True
+    # SQLite: 연결마다 설정하는 PRAGMA (WAL, synchronous=NORMAL 은 항상 사용)
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size_mb: int = 256
+    sqlite_cache_size_mb: int = 64
+    # 검증 결과 보관 기간 (기본 0 = 지우지 않음, 예: 90 으로 두면 90일 지난 결과/처리 완료 event_id 삭제):
+    # 정리 주기, 나눠 지울 행 수, 미리 만들 월별 파티션 수 (PostgreSQL, 보관 기간과 관계없이 생성)
+    result_retention_days: int = 0
+    result_retention_interval_sec: int = 3600
+    result_retention_chunk_rows: int = 5000
+    result_partition_months_ahead: int = 2
+
     database_url: str
     alembic_database_url: str
 
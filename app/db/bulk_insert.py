@@ -0,0 +1,163 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Column, Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.env_config import get_settings
+from app.db.models import (
+    ImageValidationResult,
+    OutboxMessage,
+    ProcessedEvent,
+    to_naive_utc,
+)
+from app.db.upsert import insert_ignore_duplicates
+
+config = get_settings()
+
+# COPY 로 결과 행을 받는 세션 임시 테이블 (커밋/롤백 시 비워진다)
+RESULT_STAGE_TABLE = "image_validation_result_stage"
+
+
+async def insert_results(
+    session: AsyncSession,
+    rows: list[dict[str, Any]],
+    outbox_rows: Optional[list[dict[str, Any]]] = None,
+) -> None:
+    """
+    결과 행과 발행할 outbox 행을 같은 트랜잭션에 넣는다 (커밋은 호출자).
+    outbox_rows 는 rows 와 같은 순서의 짝 (없으면 None) 이며, 결과가 새로 저장된
+    이벤트의 outbox 행만 넣는다 (재전달/중복 이벤트는 다시 발행하지 않는다).
+    DATABASE_URL 이 postgresql+asyncpg 이면 binary COPY, 그 외에는 INSERT (executemany).
+    """
+    if config.postgres_copy_enabled and is_asyncpg(session):
+        await copy_results(session, rows, outbox_rows)
+    else:
+        await orm_insert_results(session, rows, outbox_rows)
+
+
+def is_asyncpg(session: AsyncSession) -> bool:
+    return session.bind.url.drivername == "postgresql+asyncpg"
+
+
+async def orm_insert_results(
+    session: AsyncSession,
+    rows: list[dict[str, Any]],
+    outbox_rows: Optional[list[dict[str, Any]]] = None,
+) -> None:
+    # event_id 를 먼저 ProcessedEvent 에 넣고, 새로 들어간 이벤트의 결과만 저장한다
+    new_event_ids = await insert_ignore_duplicates(
+        session,
+        ProcessedEvent,
+        [
+            dict(event_id=row["event_id"], created_time=row["created_time"])
+            for row in rows
+        ],
+        index_elements=["event_id"],
+        returning=ProcessedEvent.event_id,
+    )
+    indexes = (
+        first_indexes(rows, set(new_event_ids))
+        if new_event_ids is not None
+        else range(len(rows))
+    )
+    new_rows = [rows[index] for index in indexes]
+    if new_rows:
+        await session.execute(insert(ImageValidationResult), new_rows)
+    new_outbox_rows = paired_outbox_rows(outbox_rows, indexes)
+    if new_outbox_rows:
+        await session.execute(insert(OutboxMessage), new_outbox_rows)
+
+
+async def copy_results(
+    session: AsyncSession,
+    rows: list[dict[str, Any]],
+    outbox_rows: Optional[list[dict[str, Any]]] = None,
+) -> None:
+    """
+    PostgreSQL (asyncpg) 전용: 결과 행을 binary COPY 로 임시 테이블에 넣고,
+    processed_event 에 새로 들어간 (ON CONFLICT DO NOTHING) event_id 의 행만 옮긴다.
+    outbox 행은 옮겨진 event_id 의 짝만 테이블에 바로 COPY 한다.
+    세션의 연결/트랜잭션을 그대로 쓰므로 커밋은 호출자가 한다.
+    """
+    # asyncpg 트랜잭션은 첫 SQLAlchemy 실행 때 시작되므로 COPY 전에 세션으로 먼저 실행한다
+    await session.execute(
+        text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {RESULT_STAGE_TABLE} "
+            f"(LIKE {ImageValidationResult.__tablename__} INCLUDING DEFAULTS) "
+            f"ON COMMIT DELETE ROWS"
+        )
+    )
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver = raw_connection.driver_connection
+
+    new_event_ids = set()
+    if rows:
+        table = ImageValidationResult.__table__
+        columns = [column.name for column in table.columns]
+        await driver.copy_records_to_table(
+            RESULT_STAGE_TABLE, records=copy_records(table, rows), columns=columns
+        )
+        column_list = ", ".join(columns)
+        new_event_ids = set(
+            await session.scalars(
+                text(
+                    f"WITH new_event AS ("
+                    f"INSERT INTO {ProcessedEvent.__tablename__} (event_id, created_time) "
+                    f"SELECT event_id, created_time FROM {RESULT_STAGE_TABLE} "
+                    f"ON CONFLICT (event_id) DO NOTHING RETURNING event_id) "
+                    f"INSERT INTO {table.name} ({column_list}) "
+                    f"SELECT DISTINCT ON (event_id) {column_list} "
+                    f"FROM {RESULT_STAGE_TABLE} JOIN new_event USING (event_id) "
+                    f"RETURNING event_id"
+                )
+            )
+        )
+    new_outbox_rows = paired_outbox_rows(
+        outbox_rows, first_indexes(rows, new_event_ids)
+    )
+    if new_outbox_rows:
+        table = OutboxMessage.__table__
+        await driver.copy_records_to_table(
+            table.name,
+            records=copy_records(table, new_outbox_rows),
+            columns=[column.name for column in table.columns],
+        )
+
+
+def first_indexes(rows: list[dict[str, Any]], event_ids: set[str]) -> list[int]:
+    """event_ids 에 있는 event_id 마다 첫 행의 위치만 (같은 묶음 안의 중복 제거)"""
+    selected = []
+    for index, row in enumerate(rows):
+        if row["event_id"] in event_ids:
+            event_ids.discard(row["event_id"])
+            selected.append(index)
+    return selected
+
+
+def paired_outbox_rows(
+    outbox_rows: Optional[list[Optional[dict[str, Any]]]], indexes
+) -> list[dict[str, Any]]:
+    """indexes 위치의 결과 행과 짝인 outbox 행 (짝이 없는 행은 건너뛴다)"""
+    if not outbox_rows:
+        return []
+    return [outbox_rows[index] for index in indexes if outbox_rows[index] is not None]
+
+
+def copy_records(table: Table, rows: list[dict[str, Any]]) -> list[tuple]:
+    """COPY 는 SQLAlchemy 를 거치지 않으므로 컬럼 기본값과 UTC 변환을 여기서 적용한다"""
+    columns = list(table.columns)
+    return [tuple(column_value(column, row) for column in columns) for row in rows]
+
+
+def column_value(column: Column, row: dict[str, Any]) -> Any:
+    if column.name in row:
+        value = row[column.name]
+    elif column.default is None:
+        value = None
+    elif column.default.is_callable:
+        value = column.default.arg(None)
+    else:
+        value = column.default.arg
+    return to_naive_utc(value) if isinstance(value, datetime) else value
@@ -1,15 +1,77 @@
 import os
 
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+
+from app.config.env_config import get_settings
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_async_engine(DATABASE_URL, pool_pre_ping=True)
+config = get_settings()
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def create_database_engine(url: str, writer: bool = False) -> AsyncEngine:
+    """
+    SQLite 는 WAL 과 연결별 PRAGMA 를 설정하고, writer=True 이면 연결 하나만 쓰는
+    쓰기 전용 엔진을 만든다. 프로세스 안의 쓰기는 이 연결에서 차례로 실행되고
+    (BEGIN IMMEDIATE 로 시작해 다른 프로세스와는 busy_timeout 안에서 기다린다),
+    읽기는 WAL 덕분에 쓰기와 관계없이 다른 연결에서 실행된다.
+    """
+    if not is_sqlite(url):
+        return create_async_engine(url, pool_pre_ping=True)
+
+    options = {"pool_pre_ping": True}
+    if writer:
+        options.update(pool_size=1, max_overflow=0)
+    engine = create_async_engine(url, **options)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={config.sqlite_busy_timeout_ms}")
+        cursor.execute(f"PRAGMA mmap_size={config.sqlite_mmap_size_mb * 1024 * 1024}")
+        # 음수는 KiB 단위
+        cursor.execute(f"PRAGMA cache_size={-config.sqlite_cache_size_mb * 1024}")
+        cursor.close()
+        if writer:
+            # 트랜잭션 시작은 아래 begin 이벤트에서 직접 한다
+            dbapi_connection.isolation_level = None
+
+    if writer:
+        # 읽기로 시작한 트랜잭션이 쓰기로 바뀔 때는 busy_timeout 없이 바로 "database is locked"
+        # 가 나므로 처음부터 쓰기 잠금을 잡는다
+        @event.listens_for(engine.sync_engine, "begin")
+        def begin_immediate(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+engine = create_database_engine(DATABASE_URL)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
 )
+
+# 쓰기용 세션 (SQLite 가 아니면 AsyncSessionLocal 과 같은 엔진)
+writer_engine = (
+    create_database_engine(DATABASE_URL, writer=True)
+    if is_sqlite(DATABASE_URL)
+    else engine
+)
+
+WriterSessionLocal = async_sessionmaker(
+    bind=writer_engine,
+    expire_on_commit=False,
+)
@@ -1,17 +1,39 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 import uuid
 
-from sqlalchemy import UUID, DateTime
+from sqlalchemy import DDL, UUID, DateTime, LargeBinary, String, TypeDecorator, event
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from uuid_extensions import uuid7
 
 
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class UtcDateTime(TypeDecorator):
+    """
+    timezone 없는 DateTime 컬럼에 UTC 기준으로 저장한다.
+    asyncpg 는 aware datetime 을 timestamp without time zone 에 넣지 못한다.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return to_naive_utc(value)
+
+
 class Base(DeclarativeBase):
-    pass
+    type_annotation_map = {datetime: UtcDateTime}
 
 
 class ImageValidationResult(Base):
     __tablename__ = "image_validation_result"
+    # PostgreSQL 은 created_time 월 단위 range partition (파티션 키는 기본 키에 포함되어야 한다)
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_time)"}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid7
@@ -19,13 +41,72 @@ class ImageValidationResult(Base):
     is_blank: Mapped[bool] = mapped_column(default=False)
     is_folded: Mapped[bool] = mapped_column(default=False)
     tilt_angle: Mapped[float] = mapped_column(default=0.0)
-    gid: Mapped[uuid.UUID] = mapped_column(default=None)
+    gid: Mapped[uuid.UUID] = mapped_column(default=None, index=True)
+    # 요청 메시지의 event_id, 중복 저장은 ProcessedEvent 로 막는다
+    # (partition 된 테이블에는 파티션 키 없는 유니크 인덱스를 만들 수 없다)
+    event_id: Mapped[Optional[str]] = mapped_column(
+        String(64), index=True, nullable=True
+    )
     message_received_time: Mapped[datetime] = mapped_column(nullable=False)
     file_received_time: Mapped[datetime] = mapped_column(nullable=False)
-    created_time: Mapped[datetime] = mapped_column(nullable=False)
+    created_time: Mapped[datetime] = mapped_column(
+        primary_key=True, nullable=False, index=True
+    )
 
     def __repr__(self) -> str:
         return (
             f"ImageValidationResult(id={self.id!r}, is_blank={self.is_blank!r}, "
             f"is_folded={self.is_folded!r}, tilt_angle={self.tilt_angle!r}, gid={self.gid!r})"
         )
+
+
+# create_all 로 만든 PostgreSQL 테이블도 바로 쓸 수 있도록 기본 파티션을 함께 만든다
+# (운영 DB 는 마이그레이션과 ResultRetention 이 월별 파티션을 미리 만든다)
+event.listen(
+    ImageValidationResult.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS image_validation_result_default "
+        "PARTITION OF image_validation_result DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+class ProcessedEvent(Base):
+    """결과를 저장한 요청 event_id (재전달된 이벤트의 결과를 다시 저장하지 않기 위한 유니크 키)"""
+
+    __tablename__ = "processed_event"
+
+    event_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    created_time: Mapped[datetime] = mapped_column(nullable=False, index=True)
+
+
+class ValidationResultCache(Base):
+    """검증 결과 캐시의 DB 계층 (키: ETag 또는 내용 해시 + 검출기 설정 버전)"""
+
+    __tablename__ = "validation_result_cache"
+
+    key: Mapped[str] = mapped_column(String(160), primary_key=True)
+    result: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_time: Mapped[datetime] = mapped_column(nullable=False, index=True)
+
+
+class OutboxMessage(Base):
+    """
+    발행할 결과 메시지 (transactional outbox).
+    결과 행과 같은 트랜잭션으로 저장하고, relay 가 모아서 발행한 뒤 sent_time 을 채운다.
+    """
+
+    __tablename__ = "outbox_message"
+
+    # 발행 메시지의 event_id 로도 쓴다 (재발행해도 같은 event_id)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid7
+    )
+    trace_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    routing_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    body: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_time: Mapped[datetime] = mapped_column(nullable=False, index=True)
+    sent_time: Mapped[Optional[datetime]] = mapped_column(nullable=True, index=True)
+    # relay 가 발행하려고 가져간 행은 이 시각까지 다른 relay 가 가져가지 않는다
+    claimed_until: Mapped[Optional[datetime]] = mapped_column(nullable=True)
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.bulk_insert import insert_results
+from app.db.database import WriterSessionLocal
+
+
+class ResultWriter:
+    """
+    결과 행을 모아 한 트랜잭션의 multi-row INSERT 로 저장하는 백그라운드 writer.
+
+    max_batch_rows 개가 모이거나 첫 행을 받은 뒤 flush_interval_ms 가 지나면 저장한다.
+    write() 는 커밋이 끝난 뒤에 돌아오므로 호출자는 그 다음에 ack/발행한다.
+    outbox 행을 함께 넘기면 결과 행과 같은 트랜잭션으로 저장한다.
+    큐 (queue_size 행) 가 가득 차면 write() 가 기다리므로 DB 가 느리면 메시지 처리도 늦춰진다.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = WriterSessionLocal,
+        max_batch_rows: int = 100,
+        flush_interval_ms: float = 20,
+        queue_size: int = 1000,
+    ):
+        self.session_factory = session_factory
+        self.max_batch_rows = max_batch_rows
+        self.flush_interval = flush_interval_ms / 1000
+        self.queue_size = queue_size
+
+        # (결과 행, outbox 행, 커밋 완료 future), None 은 종료 신호
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = Counter()
+
+    def start(self):
+        self._queue = asyncio.Queue(self.queue_size)
+        self._task = asyncio.create_task(self._run())
+        logging.info(
+            f"✅ 결과 writer 시작: {self.max_batch_rows}행 / {self.flush_interval * 1000:g}ms 마다 저장"
+        )
+
+    async def write(
+        self,
+        rows: list[dict[str, Any]],
+        outbox_rows: Optional[list[dict[str, Any]]] = None,
+    ) -> None:
+        """rows (와 같은 순서의 outbox_rows) 가 커밋될 때까지 기다린다 (저장 실패 시 예외)"""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for index, row in enumerate(rows):
+            future = loop.create_future()
+            outbox_row = outbox_rows[index] if outbox_rows else None
+            await self._queue.put((row, outbox_row, future))
+            futures.append(future)
+        await asyncio.gather(*futures)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            flush_at = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_rows:
+                try:
+                    # 이미 쌓인 행은 기다리지 않고 꺼낸다
+                    entry = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = flush_at - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple]):
+        start = time.perf_counter()
+        try:
+            await self._insert(
+                [row for row, _, _ in batch],
+                [outbox_row for _, outbox_row, _ in batch],
+            )
+        except Exception as e:
+            if len(batch) == 1:
+                self._resolve(batch, e)
+                return
+            # 한 행 때문에 전체가 실패했을 수 있으므로 행마다 다시 저장한다
+            logging.warning(f"⚠️ 결과 일괄 저장 실패, 행 단위로 재시도: {e}")
+            for entry in batch:
+                await self._flush([entry])
+            return
+        self.stats["flushes"] += 1
+        self.stats["rows"] += len(batch)
+        self.stats["flush_ms"] += round((time.perf_counter() - start) * 1000)
+        self._resolve(batch)
+
+    async def _insert(
+        self,
+        rows: list[dict[str, Any]],
+        outbox_rows: list[Optional[dict[str, Any]]],
+    ):
+        async with self.session_factory() as session:
+            await insert_results(session, rows, outbox_rows)
+            await session.commit()
+
+    def _resolve(self, batch, error: Optional[Exception] = None):
+        if error is not None:
+            self.stats["failed_rows"] += len(batch)
+            logging.error(f"❌ 결과 저장 실패: {error}")
+        for _, _, future in batch:
+            # 기다리던 쪽이 취소되었으면 건너뛴다
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    async def close(self, timeout: float = 10.0):
+        """큐에 남은 행을 저장한 뒤 종료"""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logging.warning("⚠️ 결과 writer 종료 시간 초과")
+        self._task = None
+        logging.info(f"📊 결과 writer 통계: {self.snapshot()}")
+
+    def snapshot(self) -> dict[str, int]:
+        pending = self._queue.qsize() if self._queue is not None else 0
+        return {"pending": pending, **self.stats}
@@ -0,0 +1,269 @@
+import asyncio
+import logging
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Column, delete, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.sql.expression import TableClause, column, table
+
+from app.db.database import writer_engine
+from app.db.models import ImageValidationResult, ProcessedEvent, to_naive_utc
+
+PARTITION_PATTERN = re.compile(r"^image_validation_result_p(\d{4})(\d{2})$")
+# 월별 파티션 범위 밖의 행이 들어가는 기본 파티션 (models.py 의 DDL, 마이그레이션에서 생성)
+DEFAULT_PARTITION = table(
+    f"{ImageValidationResult.__tablename__}_default",
+    column("id"),
+    column("created_time"),
+)
+
+
+# 파티션 DDL 을 워커 하나만 실행하도록 잡는 advisory lock 키 (임의의 고정값)
+PARTITION_LOCK_KEY = 0x49565250
+# DETACH/DROP 은 부모 테이블에 ACCESS EXCLUSIVE 잠금을 기다리는 동안에도 결과 저장을 막으므로
+# 긴 트랜잭션 뒤에서 오래 기다리지 않고 다음 주기에 다시 시도한다
+DDL_LOCK_TIMEOUT_MS = 3000
+
+
+def month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(value: datetime) -> datetime:
+    return (value.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def partition_name(start: datetime) -> str:
+    return f"{ImageValidationResult.__tablename__}_p{start:%Y%m}"
+
+
+class ResultRetention:
+    """
+    retention_days 보다 오래된 검증 결과와 처리 완료 event_id 를 지운다 (0 이면 지우지 않음).
+
+    - PostgreSQL: image_validation_result 는 created_time 월 단위 파티션이므로 보관 기간과
+      관계없이 앞으로 쓸 파티션을 months_ahead 개월 미리 만들고, 전체가 보관 기간을 지난
+      파티션은 DROP 한다. 기본 파티션에 이미 들어간 행은 새 파티션으로 옮기고,
+      보관 기간이 지난 행은 나눠 지운다.
+    - 그 외 (SQLite 등): created_time 인덱스로 chunk_rows 개씩 나눠 지운다
+      (한 번에 지우면 긴 쓰기 잠금으로 결과 저장이 멈춘다).
+    """
+
+    def __init__(
+        self,
+        retention_days: int,
+        engine: AsyncEngine = writer_engine,
+        interval_sec: float = 3600,
+        chunk_rows: int = 5000,
+        months_ahead: int = 2,
+    ):
+        self.retention = timedelta(days=retention_days) if retention_days > 0 else None
+        self.engine = engine
+        self.interval_sec = interval_sec
+        self.chunk_rows = chunk_rows
+        self.months_ahead = months_ahead
+        self.partitioned = engine.dialect.name == "postgresql"
+
+        self._task: Optional[asyncio.Task] = None
+        self.stats = Counter()
+
+    def start(self):
+        if self.retention is None and not self.partitioned:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logging.error(f"❌ 보관 기간 정리 실패: {e}")
+            await asyncio.sleep(self.interval_sec)
+
+    async def run_once(self, now: Optional[datetime] = None):
+        now = to_naive_utc(now or datetime.now(timezone.utc))
+        cutoff = now - self.retention if self.retention is not None else None
+        if self.partitioned:
+            await self.maintain_partitions(now, cutoff)
+        if cutoff is not None:
+            if self.partitioned:
+                await self.delete_chunked(
+                    DEFAULT_PARTITION, DEFAULT_PARTITION.c.id, cutoff
+                )
+            else:
+                await self.delete_chunked(
+                    ImageValidationResult.__table__, ImageValidationResult.id, cutoff
+                )
+            await self.delete_chunked(
+                ProcessedEvent.__table__, ProcessedEvent.event_id, cutoff
+            )
+        logging.info(f"🧹 보관 기간 정리 완료: {self.snapshot()}")
+
+    async def maintain_partitions(self, now: datetime, cutoff: Optional[datetime]):
+        """
+        파티션 생성/삭제. 워커 프로세스마다 이 작업이 돌므로 advisory lock 을 잡은
+        하나만 실행하고, 나머지는 건너뛴다 (다음 주기에 다시 확인).
+        DDL 은 잠금을 잡은 연결에서 파티션마다 짧은 트랜잭션으로 실행한다.
+        """
+        async with self.engine.connect() as connection:
+            locked = await connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": PARTITION_LOCK_KEY},
+            )
+            await connection.commit()
+            if not locked:
+                self.stats["partition_lock_busy"] += 1
+                return
+            try:
+                await self.create_partitions(connection, now)
+                if cutoff is not None:
+                    await self.drop_partitions(connection, cutoff)
+            finally:
+                await connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": PARTITION_LOCK_KEY},
+                )
+                await connection.commit()
+
+    async def partitions(self, connection: AsyncConnection) -> dict[str, datetime]:
+        """월별 파티션 이름 → 시작 시각 (기본 파티션 제외)"""
+        names = await connection.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :parent"
+            ),
+            {"parent": ImageValidationResult.__tablename__},
+        )
+        partitions = {}
+        for name in names:
+            match = PARTITION_PATTERN.match(name)
+            if match:
+                partitions[name] = datetime(int(match[1]), int(match[2]), 1)
+        return partitions
+
+    @staticmethod
+    async def begin_ddl(connection: AsyncConnection):
+        await connection.begin()
+        await connection.execute(
+            text(f"SET LOCAL lock_timeout = {DDL_LOCK_TIMEOUT_MS}")
+        )
+
+    async def create_partitions(self, connection: AsyncConnection, now: datetime):
+        start = month_start(now)
+        for _ in range(self.months_ahead + 1):
+            end = next_month(start)
+            name = partition_name(start)
+            try:
+                await self.create_partition(connection, name, start, end)
+            except Exception as e:
+                logging.error(f"❌ 파티션 생성 실패: {name}: {e}")
+            start = end
+
+    async def create_partition(
+        self, connection: AsyncConnection, name: str, start: datetime, end: datetime
+    ):
+        """
+        기본 파티션에 이 범위의 행이 있으면 CREATE ... PARTITION OF 가 실패하므로
+        한 트랜잭션에서 기본 파티션을 떼고, 파티션을 만들고, 행을 옮긴 뒤 다시 붙인다.
+        """
+        parent = ImageValidationResult.__tablename__
+        default = DEFAULT_PARTITION.name
+        in_range = (DEFAULT_PARTITION.c.created_time >= start) & (
+            DEFAULT_PARTITION.c.created_time < end
+        )
+        await self.begin_ddl(connection)
+        try:
+            # 잠금을 잡은 뒤 같은 트랜잭션에서 확인한다
+            if name in await self.partitions(connection):
+                await connection.rollback()
+                return
+            moving = await connection.scalar(
+                select(select(DEFAULT_PARTITION.c.id).where(in_range).exists())
+            )
+            if moving:
+                await connection.execute(
+                    text(f"ALTER TABLE {parent} DETACH PARTITION {default}")
+                )
+            await connection.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF {parent} "
+                    f"FOR VALUES FROM ('{start.isoformat()}') "
+                    f"TO ('{end.isoformat()}')"
+                )
+            )
+            moved = 0
+            if moving:
+                # 부모 테이블로 넣으면 방금 만든 파티션으로 들어간다
+                await connection.execute(
+                    text(
+                        f"INSERT INTO {parent} SELECT * FROM {default} "
+                        f"WHERE created_time >= :start AND created_time < :end"
+                    ),
+                    {"start": start, "end": end},
+                )
+                moved = (
+                    await connection.execute(delete(DEFAULT_PARTITION).where(in_range))
+                ).rowcount
+                await connection.execute(
+                    text(f"ALTER TABLE {parent} ATTACH PARTITION {default} DEFAULT")
+                )
+            await connection.commit()
+        except Exception:
+            await connection.rollback()
+            raise
+        self.stats["created_partitions"] += 1
+        self.stats["moved_default_rows"] += moved
+        logging.info(f"✅ 파티션 생성: {name} (기본 파티션에서 옮긴 행 {moved}개)")
+
+    async def drop_partitions(self, connection: AsyncConnection, cutoff: datetime):
+        partitions = await self.partitions(connection)
+        await connection.commit()
+        for name, start in sorted(partitions.items()):
+            # 파티션의 모든 행이 보관 기간을 지났을 때만 지운다
+            if next_month(start) > cutoff:
+                continue
+            await self.begin_ddl(connection)
+            try:
+                await connection.execute(text(f"DROP TABLE {name}"))
+                await connection.commit()
+            except Exception:
+                await connection.rollback()
+                raise
+            self.stats["dropped_partitions"] += 1
+            logging.info(f"🗑️ 보관 기간이 지난 파티션 삭제: {name}")
+
+    async def delete_chunked(
+        self, target: TableClause, key: Column, cutoff: datetime
+    ) -> int:
+        """created_time 이 cutoff 보다 오래된 행을 key 로 chunk_rows 개씩 지운다"""
+        total = 0
+        while True:
+            expired = (
+                select(key).where(target.c.created_time < cutoff).limit(self.chunk_rows)
+            )
+            async with self.engine.begin() as connection:
+                result = await connection.execute(
+                    delete(target).where(key.in_(expired))
+                )
+            total += result.rowcount
+            if result.rowcount < self.chunk_rows:
+                break
+            # 사이사이 다른 쓰기가 잠금을 잡을 수 있도록 양보한다
+            await asyncio.sleep(0)
+        self.stats[f"deleted_{target.name}"] += total
+        return total
+
+    async def close(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(self.stats)
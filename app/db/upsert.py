@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from sqlalchemy import Column, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def insert_ignore_duplicates(
+    session: AsyncSession,
+    model,
+    rows: list[dict[str, Any]],
+    index_elements: list[str],
+    returning: Optional[Column] = None,
+) -> Optional[list]:
+    """
+    rows 를 한 번의 INSERT (executemany) 로 넣고, index_elements 유니크 인덱스와
+    겹치는 행은 건너뛴다 (ON CONFLICT DO NOTHING). 지원하지 않는 DB 는 일반 INSERT.
+    returning 을 주면 실제로 넣은 행의 그 컬럼 값을 돌려준다 (일반 INSERT 는 None).
+    """
+    if not rows:
+        return []
+    dialect = session.bind.dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(model).on_conflict_do_nothing(
+            index_elements=index_elements
+        )
+    elif dialect == "sqlite":
+        statement = sqlite.insert(model).on_conflict_do_nothing(
+            index_elements=index_elements
+        )
+    else:
+        await session.execute(insert(model), rows)
+        return None
+    if returning is None:
+        await session.execute(statement, rows)
+        return None
+    result = await session.execute(statement.returning(returning), rows)
+    return list(result.scalars())
@@ -4,8 +4,13 @@ import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.service.detector.blank_detector import BlankDetector
-from app.service.validation_service import ValidationService
+from app.db.result_writer import ResultWriter
+from app.db.retention import ResultRetention
+from app.service.detector_factory import build_detectors
+from app.service.near_duplicate_index import NearDuplicateIndex
+from app.service.result_cache import ResultCache, detector_config_version
+from app.service.utils.image_decoder import DecodeOptions
+from app.service.validation_executor import ValidationExecutor
 
 import asyncio
 import pytz
@@ -28,10 +33,65 @@ LOGGER = logging.getLogger(__name__)
 async def main():
     minio = AioBoto()
     await minio.connect()
-    blank_detector = BlankDetector()
-    validation_service = ValidationService([blank_detector])
-
-    consumer = AioConsumer(minio_manager=minio, validation_service=validation_service)
+    validation_executor = ValidationExecutor(
+        build_detectors,
+        mode=config.validation_executor,
+        max_workers=config.validation_workers,
+        shared_memory_slots=config.shared_memory_slots,
+        shared_memory_slot_mb=config.shared_memory_slot_mb,
+        degradation_policy=config.degradation_policy,
+    )
+    validation_executor.start()
+
+    # 검출기들이 요구하는 최소 해상도/컬러 여부로 디코딩 배율을 정한다
+    decode_options = DecodeOptions.for_detectors(
+        build_detectors(), pixel_budget=config.decode_pixel_budget
+    )
+
+    result_cache = None
+    if config.result_cache_enabled:
+        result_cache = ResultCache(
+            detector_config_version(build_detectors()),
+            max_entries=config.result_cache_max_entries,
+            ttl_sec=config.result_cache_ttl_sec,
+            persistent=config.result_cache_persistent,
+        )
+        await result_cache.purge_expired()
+
+    near_duplicate_index = None
+    if config.near_duplicate_enabled:
+        near_duplicate_index = NearDuplicateIndex(
+            max_distance=config.near_duplicate_max_distance,
+            max_entries=config.near_duplicate_max_entries,
+        )
+
+    result_writer = None
+    if config.result_writer_enabled:
+        result_writer = ResultWriter(
+            max_batch_rows=config.result_writer_batch_rows,
+            flush_interval_ms=config.result_writer_flush_interval_ms,
+            queue_size=config.result_writer_queue_size,
+        )
+        result_writer.start()
+
+    # 오래된 결과는 파티션 단위 (PostgreSQL) 또는 나눠서 지운다
+    # 월별 파티션 생성은 보관 기간을 0 (지우지 않음) 으로 두어도 실행한다
+    result_retention = ResultRetention(
+        config.result_retention_days,
+        interval_sec=config.result_retention_interval_sec,
+        chunk_rows=config.result_retention_chunk_rows,
+        months_ahead=config.result_partition_months_ahead,
+    )
+    result_retention.start()
+
+    consumer = AioConsumer(
+        minio_manager=minio,
+        validation_executor=validation_executor,
+        decode_options=decode_options,
+        result_cache=result_cache,
+        near_duplicate_index=near_duplicate_index,
+        result_writer=result_writer,
+    )
     await consumer.connect()
 
     consume_task = asyncio.create_task(consumer.consume())
@@ -48,6 +108,11 @@ async def main():
         except asyncio.CancelledError:
             print("consume_task 취소됨")
         await consumer.close()
+        await result_retention.close()
+        # 처리 중이던 메시지의 결과까지 저장한 뒤 닫는다
+        if result_writer is not None:
+            await result_writer.close()
+        validation_executor.shutdown()
         if hasattr(minio, "close"):
             await minio.close()
 
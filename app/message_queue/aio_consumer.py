@@ -1,28 +1,48 @@
+import asyncio
+import dataclasses
 import io
-import json
+import time
 import uuid
-from dataclasses import asdict
 from datetime import datetime, timezone
+from typing import Any, Optional
 
 import aio_pika
 import logging
 
 import numpy as np
-from PIL import Image
 from aio_pika.abc import AbstractIncomingMessage
-from uuid_extensions import uuid7str
+from botocore.exceptions import ClientError
+from uuid_extensions import uuid7, uuid7str
 
 from app.config.env_config import get_settings
-from app.message_queue.consume_message import parse_message
+from app.message_queue.completed_events import CompletedEvents
+from app.message_queue.consume_message import (
+    ConsumeMessageHeader,
+    ConsumeMessagePayload,
+    message_deadline,
+    parse_message,
+)
 from app.message_queue.publish_message import (
     PublishMessageBody,
     PublishMessageHeader,
     ValidationServiceData,
+    encode_body,
+    header_to_dict,
 )
-from app.service.validation_service import ValidationService
+from app.message_queue.outbox_relay import OutboxRelay
+from app.message_queue.pipeline import Pipeline, Stage
+from app.message_queue.single_flight import SingleFlight
+from app.message_queue.work_item import WorkItem
+from app.service.near_duplicate_index import NearDuplicateIndex, contrast, dhash
+from app.service.result_cache import ResultCache
+from app.service.utils.image_decoder import DecodeOptions, decode_image
+from app.service.validation_executor import ValidationExecutor
+from app.service.validation_result import ValidationResult
 from app.storage.aio_boto import AioBoto
-from app.db.database import AsyncSessionLocal
-from app.db.models import ImageValidationResult
+from app.db.database import WriterSessionLocal
+from app.db.models import OutboxMessage
+from app.db.bulk_insert import insert_results
+from app.db.result_writer import ResultWriter
 
 config = get_settings()
 
@@ -35,10 +55,26 @@ class AioConsumer:
     def __init__(
         self,
         minio_manager: AioBoto,
-        validation_service: ValidationService,
+        validation_executor: ValidationExecutor,
+        decode_options: Optional[DecodeOptions] = None,
+        result_cache: Optional[ResultCache] = None,
+        near_duplicate_index: Optional[NearDuplicateIndex] = None,
+        result_writer: Optional[ResultWriter] = None,
     ):
         self.minio_manager = minio_manager
-        self.validation_service = validation_service
+        self.validation_executor = validation_executor
+        self.decode_options = decode_options
+        # 같은 객체/내용의 재요청은 저장된 결과를 재사용 (None 이면 사용 안 함)
+        self.result_cache = result_cache
+        self.cache_head_check = config.result_cache_head_check
+        # 바이트는 달라도 같은 페이지를 다시 스캔한 이미지는 지각 해시로 찾아 재사용
+        self.near_duplicate_index = near_duplicate_index
+        self.near_duplicate_min_contrast = config.near_duplicate_min_contrast
+        # 여러 메시지의 결과 행을 모아 한 트랜잭션으로 저장 (None 이면 메시지마다 커밋)
+        self.result_writer = result_writer
+        # 발행할 메시지를 결과와 같은 트랜잭션으로 outbox 에 저장하고 relay 가 모아서 발행
+        self.outbox_enabled = config.outbox_enabled
+        self._outbox_relay: Optional[OutboxRelay] = None
 
         self.amqp_url = f"amqp://{config.rabbitmq_user}:{config.rabbitmq_password}@{config.rabbitmq_host}:{config.rabbitmq_port}/"
 
@@ -49,7 +85,38 @@ class AioConsumer:
         self.publish_exchange_name = config.rabbitmq_image_validation_publish_exchange
         self.publish_routing_key = config.rabbitmq_image_validation_publish_routing_key
 
-        self.prefetch_count = 1
+        # prefetch 는 브로커가 미리 보내줄 메시지 수, max_concurrency 는 동시에 처리할 메시지 수
+        self.prefetch_count = config.rabbitmq_prefetch_count
+        self.max_concurrency = config.max_concurrent_messages
+        if self.prefetch_count < self.max_concurrency:
+            logging.warning(
+                f"⚠️ prefetch({self.prefetch_count}) < 동시 처리 수({self.max_concurrency}): "
+                f"동시 처리 수가 prefetch 로 제한됩니다."
+            )
+        self._semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+        self._in_flight: set[asyncio.Task] = set()
+        # 같은 객체에 대한 동시 요청은 다운로드/검증을 한 번만 한다
+        self.single_flight = SingleFlight()
+        # 저장까지 끝난 이벤트가 재전달되면 결과를 다시 발행만 한다
+        self.completed_events = CompletedEvents(config.completed_event_cache_size)
+
+        # 헤더 timestamp + TTL 로 마감 시각을 정하고, 지난 메시지는 처리하지 않는다
+        self.message_ttl_ms = config.rabbitmq_message_ttl_ms
+        self.deadline_margin_ms = config.deadline_margin_ms
+
+        self.consumer_mode = config.consumer_mode
+        self.batch_max_size = config.batch_max_size
+        self.batch_max_wait = config.batch_max_wait_ms / 1000
+        if self.consumer_mode == "batch" and self.prefetch_count < self.batch_max_size:
+            logging.warning(
+                f"⚠️ prefetch({self.prefetch_count}) < 배치 크기({self.batch_max_size}): "
+                f"배치가 prefetch 크기로 제한됩니다."
+            )
+        self._batch_queue: Optional[asyncio.Queue[WorkItem]] = None
+        self._batch_task: Optional[asyncio.Task] = None
+
+        self._pipeline: Optional[Pipeline] = None
+        self._pipeline_stats_task: Optional[asyncio.Task] = None
 
         self.dlx_name = config.rabbitmq_image_validation_dlx
         self.dlx_routing_key = config.rabbitmq_image_validation_dlx_routing_key
@@ -85,7 +152,7 @@ class AioConsumer:
         args = {
             "x-dead-letter-exchange": self.dlx_name,
             "x-dead-letter-routing-key": self.dlx_routing_key,
-            "x-message-ttl": 10000,  # 10초
+            "x-message-ttl": self.message_ttl_ms,
         }
 
         self._consume_queue = await self._channel.declare_queue(
@@ -99,110 +166,705 @@ class AioConsumer:
         )
 
     async def on_message(self, message: AbstractIncomingMessage) -> None:
-        async with message.process(requeue=True):
-            message_received_time = datetime.now(timezone.utc)
+        # aio_pika 는 메시지마다 태스크를 만들어 콜백을 호출하므로 세마포어로 동시 처리 수를 제한
+        task = asyncio.current_task()
+        self._in_flight.add(task)
+        try:
+            async with self._semaphore:
+                await self.handle_message(message)
+        finally:
+            self._in_flight.discard(task)
+
+    async def handle_message(self, message: AbstractIncomingMessage) -> None:
+        # ack/nack 은 메시지 단위로 message.process 가 처리 (마감이 지난 메시지는 직접 reject)
+        async with message.process(requeue=True, ignore_processed=True):
+            item = WorkItem(message, datetime.now(timezone.utc))
             logging.info("📩 메시지 수신!")
 
-            header, payload = parse_message(message)
-            if not header or not payload:
+            item.header, item.payload = parse_message(message)
+            if not item.header or not item.payload:
                 logging.warning("⚠️ 메시지 파싱 실패로 인해 처리를 중단합니다.")
                 return
 
-            gid = payload.gid
-            original_object_key = payload.original_object_key
-            download_bucket_name = payload.bucket
-
             logging.info(
-                f"✅ 메시지 파싱 완료 - GID: {gid}, Bucket: {download_bucket_name}"
+                f"✅ 메시지 파싱 완료 - GID: {item.payload.gid}, Bucket: {item.payload.bucket}"
             )
 
-            file_obj = io.BytesIO()
+            item.deadline = self.message_deadline(item.header)
+            if self.is_expired(item.deadline):
+                await self.reject_expired(message, item.payload.gid)
+                return
 
             try:
-                await self.minio_manager.download_image_with_client(
-                    bucket_name=download_bucket_name,
-                    key=original_object_key,
-                    file_obj=file_obj,
-                )
-                file_received_time = datetime.now(timezone.utc)
-                file_length = file_obj.getbuffer().nbytes
+                resolved = await self.resolve_result(item)
+            except Exception as e:
+                logging.error(f"❌ 이미지 처리 실패: {e}")
+                return
+            if not resolved:
+                await self.reject_expired(message, item.payload.gid)
+                return
 
-                logging.info(f"✅ MinIO 파일 다운로드 성공: Size: {file_length} bytes")
+            try:
+                await self.save_results([item])
+                await self.publish_results([item])
+            except Exception as e:
+                logging.error(f"저장 실패: {e}")
 
-                file_obj.seek(0)
-                image = Image.open(file_obj)
-                image.verify()
-                file_obj.seek(0)
-                image = Image.open(file_obj)
+    def message_deadline(self, header: ConsumeMessageHeader) -> Optional[float]:
+        return message_deadline(header, self.message_ttl_ms, self.deadline_margin_ms)
+
+    @staticmethod
+    def is_expired(deadline: Optional[float]) -> bool:
+        return deadline is not None and time.time() >= deadline
+
+    @staticmethod
+    async def reject_expired(message: AbstractIncomingMessage, gid: str) -> None:
+        # 결과가 늦어 의미가 없으므로 TTL 만료와 같이 dead letter 로 보낸다
+        logging.warning(f"⏰ 마감 시간 초과로 처리 중단: {gid}")
+        await message.reject(requeue=False)
+
+    async def resolve_result(self, item: WorkItem) -> bool:
+        """
+        다운로드 → 디코딩 → 검증으로 item.validation_result 를 채운다.
+        같은 bucket/key 를 이미 처리 중이면 그 결과를 기다려 함께 쓰므로
+        중복 전달이 몰려도 다운로드와 검증은 한 번만 한다. 마감이 지나 검증하지 못하면 False.
+        """
+        if await self.lookup_completed(item):
+            return True
+        key = (item.payload.bucket, item.payload.original_object_key)
+        while True:
+            outcome, shared = await self.single_flight.do(
+                key, lambda: self.compute_result(item)
+            )
+            if outcome is not None:
+                break
+            # 앞선 메시지가 마감으로 중단된 경우 이 메시지의 마감이 남아 있으면 다시 시도
+            if not shared or self.is_expired(item.deadline):
+                return False
+
+        if shared:
+            result, item.file_received_time = outcome
+            item.validation_result = dataclasses.replace(
+                result, reused_from="single_flight"
+            )
+            logging.info(f"🔗 처리 중인 같은 객체의 결과 사용: {item.payload.gid}")
+        return True
 
-            except Exception as e:
-                logging.error(f"❌ 이미지 로딩 실패: {e}")
+    async def lookup_completed(self, item: WorkItem) -> bool:
+        """이미 저장까지 끝난 이벤트의 재전달이면 그 결과를 채운다 (다운로드 전)"""
+        result = await self.completed_events.get(
+            item.header.event_id, bool(item.message.redelivered)
+        )
+        if result is None:
+            return False
+        item.validation_result = dataclasses.replace(result, reused_from="replay")
+        item.replayed = True
+        logging.info(
+            f"🔁 처리 완료된 이벤트 재전달, 저장/검증 없이 처리합니다: {item.payload.gid}"
+        )
+        return True
+
+    async def compute_result(
+        self, item: WorkItem
+    ) -> Optional[tuple[ValidationResult, datetime]]:
+        await self.load_item(item)
+        if item.validation_result is None:
+            if self.is_expired(item.deadline):
+                item.image = None
+                return None
+            item.validation_result = await self.validation_executor.validate(
+                item.image, item.deadline
+            )
+            item.image = None
+            await self.remember_result(item)
+        return item.validation_result, item.file_received_time
+
+    async def load_item(self, item: WorkItem) -> None:
+        """
+        캐시에 결과가 있으면 validation_result 를, 없으면 디코딩한 image 를 채운다.
+        ETag 로 찾으면 다운로드도, 내용 해시로 찾으면 디코딩/검증을 건너뛴다.
+        """
+        if await self.lookup_cached_result(item):
+            return
+        await self.fetch_file(item)
+        try:
+            if await self.lookup_cached_content(item):
                 return
+            # 디코딩은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            item.image = await asyncio.to_thread(
+                decode_image, item.file_obj, self.decode_options
+            )
+        finally:
+            item.file_obj = None
+        await self.lookup_near_duplicate(item)
+
+    async def fetch_file(self, item: WorkItem) -> None:
+        try:
+            item.file_obj, item.file_received_time = await self.download_file(
+                item.payload, item.etag
+            )
+        except ClientError as e:
+            if item.etag is None or e.response.get("Error", {}).get("Code") not in (
+                "PreconditionFailed",
+                "412",
+            ):
+                raise
+            # HEAD 이후 객체가 바뀌었으므로 ETag 키는 버리고 다시 받는다
+            logging.info(f"🔄 객체 변경으로 재다운로드: {item.payload.gid}")
+            item.etag = None
+            item.cache_keys.clear()
+            item.file_obj, item.file_received_time = await self.download_file(
+                item.payload
+            )
 
-            try:
-                image_np = np.array(image)
-                validation_result = self.validation_service.validate(image_np)
-                created_time = datetime.now(timezone.utc)
-
-                async with AsyncSessionLocal() as session:
-                    validation_result_orm = ImageValidationResult(
-                        gid=uuid.UUID(gid),
-                        is_blank=validation_result.is_blank,
-                        is_folded=False,
-                        tilt_angle=0.1,
-                        message_received_time=message_received_time,
-                        file_received_time=file_received_time,
-                        created_time=created_time,
-                    )
-                    session.add(validation_result_orm)
-                    await session.commit()
-                    logging.info("✅ DB에 정보 저장 완료")
+    async def download_file(
+        self, payload: ConsumeMessagePayload, etag: Optional[str] = None
+    ) -> tuple[io.BytesIO, datetime]:
+        file_obj = io.BytesIO()
+        await self.minio_manager.download_image_with_client(
+            bucket_name=payload.bucket,
+            key=payload.original_object_key,
+            file_obj=file_obj,
+            etag=etag,
+        )
+        file_received_time = datetime.now(timezone.utc)
+        file_length = file_obj.getbuffer().nbytes
+
+        logging.info(f"✅ MinIO 파일 다운로드 성공: Size: {file_length} bytes")
+        return file_obj, file_received_time
+
+    async def lookup_cached_result(self, item: WorkItem) -> bool:
+        """HEAD 로 받은 ETag 로 캐시를 찾는다 (다운로드 전)"""
+        if self.result_cache is None or not self.cache_head_check:
+            return False
+        try:
+            item.etag = await self.minio_manager.head_object_etag(
+                item.payload.bucket, item.payload.original_object_key
+            )
+        except Exception as e:
+            logging.warning(f"⚠️ ETag 조회 실패: {e}")
+            return False
+        if not item.etag:
+            return False
+        item.cache_keys.append(
+            self.result_cache.etag_key(
+                item.payload.bucket, item.payload.original_object_key, item.etag
+            )
+        )
+        return await self.use_cached_result(item)
+
+    async def lookup_cached_content(self, item: WorkItem) -> bool:
+        """다운로드한 바이트의 해시로 캐시를 찾는다 (디코딩 전)"""
+        if self.result_cache is None:
+            return False
+        with item.file_obj.getbuffer() as data:
+            item.cache_keys.append(self.result_cache.content_key(data))
+        return await self.use_cached_result(item)
+
+    async def use_cached_result(self, item: WorkItem) -> bool:
+        result = await self.result_cache.get(*item.cache_keys)
+        if result is None:
+            return False
+        item.validation_result = dataclasses.replace(result, reused_from="cache")
+        if item.file_received_time is None:
+            item.file_received_time = datetime.now(timezone.utc)
+        logging.info(f"♻️ 캐시된 검증 결과 사용: {item.payload.gid}")
+        return True
+
+    async def lookup_near_duplicate(self, item: WorkItem) -> bool:
+        """
+        디코딩한 이미지의 dHash 와 가까운 이전 결과를 찾는다 (검증 전).
+        dHash 는 가는 접힌 자국이나 작은 기울기 차이를 구분하지 못하므로 빈 페이지 판정만
+        재사용한다 (빈 페이지면 접힘/기울기 검출기는 어차피 건너뛴다).
+        """
+        if self.near_duplicate_index is None:
+            return False
+        item.perceptual_hash = await asyncio.to_thread(self.perceptual_hash, item.image)
+        if item.perceptual_hash is None:
+            return False
+        match = self.near_duplicate_index.lookup(item.perceptual_hash)
+        if match is None:
+            return False
+        result, distance = match
+        if result.is_blank is not True:
+            return False
+        item.validation_result = dataclasses.replace(
+            result, reused_from="near_duplicate", near_duplicate_distance=distance
+        )
+        item.image = None
+        logging.info(
+            f"♻️ 유사 이미지 결과 재사용: {item.payload.gid} (거리 {distance})"
+        )
+        return True
+
+    def perceptual_hash(self, image: np.ndarray) -> Optional[int]:
+        # 거의 빈 페이지는 해시가 노이즈로 정해져 서로 다른 페이지가 겹치므로 색인하지 않는다
+        if contrast(image) < self.near_duplicate_min_contrast:
+            return None
+        return dhash(image)
+
+    async def remember_result(self, item: WorkItem) -> None:
+        """새로 검증한 결과를 캐시/유사 이미지 색인에 넣는다"""
+        result = item.validation_result
+        if result is None or result.is_partial:
+            return
+        if self.result_cache is not None:
+            await self.result_cache.put(item.cache_keys, result)
+        if (
+            self.near_duplicate_index is not None
+            and item.perceptual_hash is not None
+            and result.reused_from is None
+            and result.is_blank is True
+        ):
+            self.near_duplicate_index.add(item.perceptual_hash, result)
+
+    async def save_results(self, items: list[WorkItem]) -> None:
+        """
+        결과 행을 한 번의 INSERT 로 저장하고 처리 완료 이벤트로 기억한다.
+        같은 event_id 의 행이 이미 있으면 (다른 워커가 먼저 저장한 재전달) 건너뛴다.
+        """
+        items = [item for item in items if not item.replayed]
+        if not items:
+            return
+        rows = [
+            self.build_result_row(
+                item.payload.gid,
+                item.header.event_id,
+                item.validation_result,
+                item.message_received_time,
+                item.file_received_time,
+            )
+            for item in items
+        ]
+        outbox_rows = (
+            [self.build_outbox_row(item) for item in items]
+            if self.outbox_enabled
+            else None
+        )
+        if self.result_writer is not None:
+            # 커밋이 끝난 뒤 돌아오므로 이후의 발행/ack 는 저장된 결과에 대해서만 일어난다
+            await self.result_writer.write(rows, outbox_rows)
+        else:
+            async with WriterSessionLocal() as session:
+                await insert_results(session, rows, outbox_rows)
+                await session.commit()
+        if self._outbox_relay is not None:
+            self._outbox_relay.notify()
+        for item in items:
+            self.completed_events.add(item.header.event_id, item.validation_result)
+        logging.info(f"✅ DB에 정보 저장 완료: {len(items)}건")
+
+    @staticmethod
+    def build_result_row(
+        gid: str,
+        event_id: str,
+        validation_result: ValidationResult,
+        message_received_time: datetime,
+        file_received_time: datetime,
+    ) -> dict[str, Any]:
+        return dict(
+            gid=uuid.UUID(gid),
+            event_id=event_id,
+            is_blank=validation_result.is_blank,
+            is_folded=bool(validation_result.is_folded),
+            tilt_angle=validation_result.tilt_angle or 0.0,
+            message_received_time=message_received_time,
+            file_received_time=file_received_time,
+            created_time=datetime.now(timezone.utc),
+        )
 
-                data = ValidationServiceData(
-                    is_blank=validation_result.is_blank,
-                )
+    def build_outbox_row(self, item: WorkItem) -> dict[str, Any]:
+        return dict(
+            id=uuid7(),
+            trace_id=item.header.trace_id,
+            routing_key=self.publish_routing_key,
+            body=encode_body(
+                self.build_publish_body(item.payload.gid, item.validation_result)
+            ),
+            created_time=datetime.now(timezone.utc),
+        )
 
-                body = PublishMessageBody(
-                    gid=gid,
-                    status="success",
-                    completed_at=datetime.now(timezone.utc).isoformat(),
-                    payload=data,
-                )
-                await self.publish_message(trace_id=header.trace_id, body=body)
+    @staticmethod
+    def build_publish_body(
+        gid: str, validation_result: ValidationResult
+    ) -> PublishMessageBody:
+        data = ValidationServiceData(
+            is_blank=validation_result.is_blank,
+            is_folded=validation_result.is_folded,
+            tilt_angle=validation_result.tilt_angle,
+        )
+        return PublishMessageBody(
+            gid=gid,
+            status="success",
+            completed_at=datetime.now(timezone.utc).isoformat(),
+            payload=data,
+            partial=validation_result.is_partial,
+            skipped_detectors=validation_result.deadline_skipped_detectors,
+            degraded_detectors=validation_result.degraded_detectors,
+            reused_from=validation_result.reused_from,
+        )
+
+    async def on_batch_message(self, message: AbstractIncomingMessage) -> None:
+        # 배치 모드에서는 수신만 하고 ack 는 배치 처리 후 한 번에 한다
+        await self._batch_queue.put(WorkItem(message, datetime.now(timezone.utc)))
+
+    async def batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.batch_max_wait
+            while len(batch) < self.batch_max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._batch_queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            # 배치는 순서대로 하나씩 처리되므로 multiple ack 가 다른 배치의 메시지를 건드리지 않는다
+            # 한 배치의 실패로 루프 (배치 모드 수신) 가 멈추지 않도록 로그만 남긴다
+            try:
+                await self.process_batch(batch)
             except Exception as e:
-                logging.error(f"저장 실패: {e}")
+                logging.error(f"❌ 배치 처리 중 예외: {e}")
+
+    async def process_batch(self, batch: list[WorkItem]) -> None:
+        logging.info(f"📦 배치 처리 시작: {len(batch)}건")
+        try:
+            await self.handle_batch(batch)
+        except Exception as e:
+            logging.error(f"❌ 배치 처리 실패: {e}")
+            error = e
+        else:
+            error = None
+
+        # 마감이 지나 reject 한 메시지는 multiple ack/nack 의 기준 태그로 쓰지 않는다
+        remaining = [item.message for item in batch if not item.expired]
+        if not remaining:
+            return
+        last_message = max(remaining, key=lambda m: m.delivery_tag)
+        # 재연결로 채널이 닫혔으면 실패하지만, 브로커가 ack 되지 않은 메시지를 다시 보낸다
+        try:
+            if error is not None:
+                await last_message.nack(multiple=True, requeue=True)
+            else:
+                await last_message.ack(multiple=True)
+        except Exception as e:
+            logging.error(f"❌ 배치 ack/nack 실패: {e}")
+
+    async def handle_batch(self, batch: list[WorkItem]) -> None:
+        parsed, replayed = [], []
+        for item in batch:
+            item.header, item.payload = parse_message(item.message)
+            if not item.header or not item.payload:
+                logging.warning("⚠️ 메시지 파싱 실패로 인해 처리를 중단합니다.")
+                continue
+            item.deadline = self.message_deadline(item.header)
+            if self.is_expired(item.deadline):
+                item.expired = True
+                await self.reject_expired(item.message, item.payload.gid)
+                continue
+            # 저장까지 끝난 이벤트의 재전달은 발행만 다시 한다
+            (replayed if await self.lookup_completed(item) else parsed).append(item)
+
+        # 배치 안에서 같은 객체는 첫 메시지만 다운로드/검증하고 나머지는 그 결과를 쓴다
+        leaders: dict[tuple[str, str], WorkItem] = {}
+        duplicates: list[tuple[WorkItem, WorkItem]] = []
+        for item in parsed:
+            key = (item.payload.bucket, item.payload.original_object_key)
+            if key in leaders:
+                duplicates.append((item, leaders[key]))
+            else:
+                leaders[key] = item
+        parsed = list(leaders.values())
+
+        downloads = await asyncio.gather(
+            *(self.load_item(item) for item in parsed),
+            return_exceptions=True,
+        )
+        completed, loaded = replayed, []
+        for item, download in zip(parsed, downloads):
+            if isinstance(download, Exception):
+                logging.error(f"❌ 이미지 로딩 실패: {item.payload.gid}: {download}")
+                continue
+            # 캐시에서 결과를 찾은 메시지는 검증하지 않는다
+            (completed if item.validation_result is not None else loaded).append(item)
+
+        # 배치 전체를 검출기 단위로 묶어서 검증 (이미지별 실패는 Exception 으로 돌아온다)
+        # 마감은 배치에서 가장 이른 것을 기준으로 한다
+        deadlines = [item.deadline for item in loaded if item.deadline is not None]
+        validation_results = await self.validation_executor.validate_batch(
+            [item.image for item in loaded], min(deadlines, default=None)
+        )
+        for item, validation_result in zip(loaded, validation_results):
+            item.image = None
+            if isinstance(validation_result, Exception):
+                logging.error(f"❌ 검증 실패: {item.payload.gid}: {validation_result}")
+                continue
+            item.validation_result = validation_result
+            await self.remember_result(item)
+            completed.append(item)
+        for item, leader in duplicates:
+            if leader.validation_result is None:
+                continue
+            item.validation_result = dataclasses.replace(
+                leader.validation_result, reused_from="single_flight"
+            )
+            item.file_received_time = leader.file_received_time
+            completed.append(item)
+        if not completed:
+            return
+
+        try:
+            await self.save_results(completed)
+            await self.publish_results(completed)
+        except Exception as e:
+            logging.error(f"저장 실패: {e}")
+
+    def build_pipeline(self) -> Pipeline:
+        queue_size = config.pipeline_queue_size
+        validate_workers = (
+            config.pipeline_validate_workers or self.validation_executor.max_workers
+        )
+        pipeline = Pipeline(
+            stages=[
+                Stage(
+                    "download",
+                    self.stage_download,
+                    config.pipeline_download_workers,
+                    queue_size,
+                ),
+                Stage(
+                    "decode",
+                    self.stage_decode,
+                    config.pipeline_decode_workers,
+                    queue_size,
+                ),
+                Stage("validate", self.stage_validate, validate_workers, queue_size),
+                Stage(
+                    "persist",
+                    self.stage_persist,
+                    config.pipeline_persist_workers,
+                    queue_size,
+                ),
+                Stage(
+                    "publish",
+                    self.stage_publish,
+                    config.pipeline_publish_workers,
+                    queue_size,
+                ),
+            ],
+            on_done=self.on_pipeline_done,
+            on_error=self.on_pipeline_error,
+        )
+        if self.prefetch_count > pipeline.capacity:
+            logging.warning(
+                f"⚠️ prefetch({self.prefetch_count}) > 파이프라인 용량({pipeline.capacity}): "
+                f"초과분은 다운로드 단계 앞에서 대기합니다."
+            )
+        return pipeline
+
+    async def on_pipeline_message(self, message: AbstractIncomingMessage) -> None:
+        # 첫 단계 큐가 차 있으면 여기서 대기하므로 ack 되지 않은 메시지가 prefetch 를 채운다
+        await self._pipeline.submit(WorkItem(message, datetime.now(timezone.utc)))
+
+    async def stage_download(self, item: WorkItem) -> Optional[WorkItem]:
+        logging.info("📩 메시지 수신!")
+        item.header, item.payload = parse_message(item.message)
+        if not item.header or not item.payload:
+            logging.warning("⚠️ 메시지 파싱 실패로 인해 처리를 중단합니다.")
+            return None
+
+        item.deadline = self.message_deadline(item.header)
+        if self.is_expired(item.deadline):
+            item.expired = True
+            return None
+
+        try:
+            # 재전달이나 캐시에서 결과를 찾으면 이후 단계는 저장/발행만 한다
+            if await self.lookup_completed(item):
+                return item
+            # 캐시에서 결과를 찾으면 이후 단계는 저장/발행만 한다
+            if await self.lookup_cached_result(item):
+                return item
+            await self.fetch_file(item)
+            if await self.lookup_cached_content(item):
+                item.file_obj = None
+        except Exception as e:
+            logging.error(f"❌ 이미지 로딩 실패: {e}")
+            return None
+        return item
+
+    async def stage_decode(self, item: WorkItem) -> Optional[WorkItem]:
+        if item.validation_result is not None:
+            return item
+        try:
+            item.image = await asyncio.to_thread(
+                decode_image, item.file_obj, self.decode_options
+            )
+        except Exception as e:
+            logging.error(f"❌ 이미지 로딩 실패: {e}")
+            return None
+        finally:
+            item.file_obj = None
+        await self.lookup_near_duplicate(item)
+        return item
+
+    async def stage_validate(self, item: WorkItem) -> Optional[WorkItem]:
+        if item.validation_result is not None:
+            return item
+        # 앞 단계 큐에서 기다리는 동안 마감이 지났을 수 있다
+        if self.is_expired(item.deadline):
+            item.expired = True
+            item.image = None
+            return None
+        item.validation_result = await self.validation_executor.validate(
+            item.image, item.deadline
+        )
+        item.image = None
+        await self.remember_result(item)
+        return item
+
+    async def stage_persist(self, item: WorkItem) -> WorkItem:
+        await self.save_results([item])
+        return item
+
+    async def stage_publish(self, item: WorkItem) -> WorkItem:
+        await self.publish_results([item])
+        return item
+
+    async def on_pipeline_done(self, item: WorkItem) -> None:
+        if item.expired:
+            await self.reject_expired(item.message, item.payload.gid)
+            return
+        await item.message.ack()
+
+    async def on_pipeline_error(
+        self, item: WorkItem, stage_name: str, error: Exception
+    ) -> None:
+        # 메시지 단위 처리와 동일하게 실패는 기록하고 ack 한다
+        logging.error(f"❌ {stage_name} 단계 실패: {error}")
+        await item.message.ack()
+
+    async def publish_results(self, items: list[WorkItem]) -> None:
+        # outbox 모드에서는 relay 가 모두 발행한다: 재전달된 이벤트도 처음 저장할 때 넣은
+        # outbox 행 (같은 event_id) 으로 발행이 보장되므로 ack 만 하고 다시 발행하지 않는다
+        if self.outbox_enabled:
+            return
+        # 채널이 publisher confirm 모드이므로 발행을 연달아 보내고 확인을 한꺼번에 기다린다
+        await asyncio.gather(
+            *(
+                self.publish_message(
+                    trace_id=item.header.trace_id,
+                    body=self.build_publish_body(
+                        item.payload.gid, item.validation_result
+                    ),
+                )
+                for item in items
+            )
+        )
 
     async def publish_message(self, trace_id: str, body: PublishMessageBody):
-        event_id = uuid7str()
+        await self.publish_encoded(
+            trace_id,
+            encode_body(body),
+            event_id=uuid7str(),
+            routing_key=self.publish_routing_key,
+            timestamp=datetime.now(timezone.utc),
+        )
 
+    async def publish_outbox(self, row: OutboxMessage):
+        created_time = row.created_time
+        if created_time.tzinfo is None:
+            created_time = created_time.replace(tzinfo=timezone.utc)
+        await self.publish_encoded(
+            row.trace_id,
+            row.body,
+            event_id=str(row.id),
+            routing_key=row.routing_key,
+            timestamp=created_time,
+        )
+
+    async def publish_encoded(
+        self,
+        trace_id: str,
+        body: bytes,
+        event_id: str,
+        routing_key: str,
+        timestamp: datetime,
+    ):
         headers = PublishMessageHeader(
             event_id=event_id,
-            event_type=self.publish_routing_key,
+            event_type=routing_key,
             trace_id=trace_id,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=timestamp.isoformat(),
             source_service="image-validation-worker",
         )
         message = aio_pika.Message(
-            body=json.dumps(asdict(body)).encode("utf-8"),
-            headers=asdict(headers),
+            body=body,
+            headers=header_to_dict(headers),
             content_type="application/json",
             delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
         )
 
         await self._publish_exchange.publish(
             message=message,
-            routing_key=self.publish_routing_key,
+            routing_key=routing_key,
+        )
+        logging.info(f"📤 메시지 발행 완료: {routing_key}")
+
+    def start_outbox_relay(self):
+        self._outbox_relay = OutboxRelay(
+            self.publish_outbox,
+            batch_size=config.outbox_relay_batch_size,
+            interval_ms=config.outbox_relay_interval_ms,
+            retention_sec=config.outbox_retention_sec,
+            claim_timeout_sec=config.outbox_claim_timeout_sec,
         )
-        logging.info(f"📤 메시지 발행 완료: {self.publish_routing_key}")
+        self._outbox_relay.start()
 
     async def consume(self):
         if not self._consume_queue:
             await self.connect()
 
         logging.info(f"📡 큐({self.consume_queue_name})에서 메시지 소비 시작...")
-        await self._consume_queue.consume(self.on_message, no_ack=False)
-
-    async def close(self):
+        if self.outbox_enabled:
+            self.start_outbox_relay()
+        if self.consumer_mode == "batch":
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self.batch_loop())
+            await self._consume_queue.consume(self.on_batch_message, no_ack=False)
+        elif self.consumer_mode == "pipeline":
+            self._pipeline = self.build_pipeline()
+            self._pipeline.start()
+            if config.pipeline_stats_interval_sec > 0:
+                self._pipeline_stats_task = asyncio.create_task(
+                    self._pipeline.log_stats(config.pipeline_stats_interval_sec)
+                )
+            await self._consume_queue.consume(self.on_pipeline_message, no_ack=False)
+        else:
+            await self._consume_queue.consume(self.on_message, no_ack=False)
+
+    async def close(self, timeout: float = 10.0):
+        if self._batch_task:
+            self._batch_task.cancel()
+            await asyncio.gather(self._batch_task, return_exceptions=True)
+        if self._pipeline:
+            if self._pipeline_stats_task:
+                self._pipeline_stats_task.cancel()
+            await self._pipeline.drain(timeout)
+            await self._pipeline.stop()
+        if self._in_flight:
+            logging.info(f"⏳ 처리 중인 메시지 {len(self._in_flight)}건 완료 대기...")
+            await asyncio.wait(self._in_flight, timeout=timeout)
+        if self._outbox_relay is not None:
+            await self._outbox_relay.close(timeout)
+        if self.result_cache is not None:
+            logging.info(f"📊 결과 캐시 통계: {self.result_cache.snapshot()}")
+        logging.info(f"📊 중복 요청 병합 통계: {self.single_flight.snapshot()}")
+        logging.info(f"📊 처리 완료 이벤트 통계: {self.completed_events.snapshot()}")
         if self._connection:
             await self._connection.close()
             logging.info("🔴 RabbitMQ 연결 종료")
@@ -0,0 +1,74 @@
+import logging
+from collections import Counter, OrderedDict
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.db.database import AsyncSessionLocal
+from app.db.models import ImageValidationResult
+from app.service.validation_result import ValidationResult
+
+
+class CompletedEvents:
+    """
+    결과를 저장까지 마친 event_id → 검증 결과.
+    브로커가 같은 이벤트를 다시 보내면 (requeue, 연결 끊김 등) 다운로드/검증/저장 없이
+    이 결과로 발행만 다시 한다.
+
+    - 메모리: 최근 max_entries 개 (LRU)
+    - DB: 메모리에 없고 재전달 표시가 있는 메시지만 event_id 유니크 인덱스로 조회
+      (다른 워커가 처리했거나 재시작 전에 처리한 이벤트)
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, ValidationResult] = OrderedDict()
+        self.stats = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(
+        self, event_id: str, redelivered: bool = False
+    ) -> Optional[ValidationResult]:
+        result = self._entries.get(event_id)
+        if result is not None:
+            self._entries.move_to_end(event_id)
+            self.stats["hit"] += 1
+            return result
+        if not redelivered:
+            return None
+        result = await self._get_persistent(event_id)
+        if result is None:
+            self.stats["miss"] += 1
+            return None
+        self.stats["persistent_hit"] += 1
+        self.add(event_id, result)
+        return result
+
+    def add(self, event_id: str, result: ValidationResult):
+        self._entries[event_id] = result
+        self._entries.move_to_end(event_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    async def _get_persistent(event_id: str) -> Optional[ValidationResult]:
+        try:
+            async with AsyncSessionLocal() as session:
+                row = await session.scalar(
+                    select(ImageValidationResult)
+                    .where(ImageValidationResult.event_id == event_id)
+                    .limit(1)
+                )
+        except Exception as e:
+            logging.warning(f"⚠️ 처리 완료 이벤트 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+        return ValidationResult(
+            is_blank=row.is_blank, is_folded=row.is_folded, tilt_angle=row.tilt_angle
+        )
+
+    def snapshot(self) -> dict[str, int]:
+        return {"entries": len(self._entries), **self.stats}
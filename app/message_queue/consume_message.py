@@ -1,14 +1,13 @@
-import json
 import logging
-from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Literal
 
+import msgspec
 from aio_pika.abc import AbstractIncomingMessage
 from typing_extensions import Optional
 
 
-@dataclass
-class ConsumeMessageHeader:
+class ConsumeMessageHeader(msgspec.Struct):
     event_id: str
     event_type: Literal["image.validation.requested",]
     trace_id: str
@@ -16,26 +15,46 @@ class ConsumeMessageHeader:
     source_service: str
 
 
-@dataclass
-class ConsumeMessagePayload:
+class ConsumeMessagePayload(msgspec.Struct):
     gid: str
     bucket: str
     original_object_key: str
 
 
+# 디코더는 타입 정보를 미리 컴파일해두므로 모듈 단위로 재사용
+_payload_decoder = msgspec.json.Decoder(ConsumeMessagePayload)
+
+
 # ✅ 파싱 유틸 함수
 def parse_message(
     message: AbstractIncomingMessage,
 ) -> tuple[Optional[ConsumeMessageHeader], Optional[ConsumeMessagePayload]]:
     try:
-        body_dict = json.loads(message.body.decode())
-        payload = ConsumeMessagePayload(**body_dict)
-
-        headers_dict = message.headers
-        header = ConsumeMessageHeader(**headers_dict)
+        # body 바이트에서 바로 Struct 로 디코딩 (중간 dict 없음)
+        payload = _payload_decoder.decode(message.body)
+        header = msgspec.convert(message.headers, ConsumeMessageHeader)
 
         return header, payload
 
-    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+    except (msgspec.DecodeError, msgspec.ValidationError) as e:
         logging.error(f"❌ 메시지 파싱 실패: {e}")
         return None, None
+
+
+def message_deadline(
+    header: ConsumeMessageHeader, ttl_ms: int, margin_ms: int = 0
+) -> Optional[float]:
+    """
+    발행 시각 + TTL - 여유 시간 (time.time() 기준 초).
+    TTL 이 없거나 timestamp 를 읽을 수 없으면 마감 없음 (None).
+    """
+    if ttl_ms <= 0:
+        return None
+    try:
+        sent_at = datetime.fromisoformat(header.timestamp)
+    except ValueError:
+        logging.warning(f"⚠️ 메시지 timestamp 형식 오류: {header.timestamp}")
+        return None
+    if sent_at.tzinfo is None:
+        sent_at = sent_at.replace(tzinfo=timezone.utc)
+    return sent_at.timestamp() + (ttl_ms - margin_ms) / 1000
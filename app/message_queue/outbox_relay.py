@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.database import WriterSessionLocal
+from app.db.models import OutboxMessage
+
+# 발행 완료 행 정리 주기: 보관 시간의 이 비율마다 (오래 도는 워커에서 테이블이 계속 커지지 않도록)
+PURGE_INTERVAL_RATIO = 0.1
+
+
+class OutboxRelay:
+    """
+    outbox_message 의 미발행 행을 batch_size 개씩 읽어 발행하고, 발행 확인 (publisher confirm)
+    을 받은 행만 한 번의 UPDATE 로 발행 완료 처리한다.
+
+    결과를 저장한 쪽이 notify() 를 부르면 바로 읽고, 아니면 interval_ms 마다 확인한다.
+    행을 가져가기 (claimed_until), 발행, 완료 처리는 각각 짧은 트랜잭션으로 나눠
+    브로커를 기다리는 동안 DB 잠금을 잡지 않는다. 여러 워커가 함께 돌 때는 가져가는
+    트랜잭션의 FOR UPDATE SKIP LOCKED 와 claimed_until 로 같은 행을 나눠 가지지 않는다
+    (claim 시간 안에 확인을 못 받으면 다시 발행될 수 있으며, 받는 쪽은 event_id 로 거른다).
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[OutboxMessage], Awaitable[None]],
+        session_factory: async_sessionmaker[AsyncSession] = WriterSessionLocal,
+        batch_size: int = 100,
+        interval_ms: float = 1000,
+        retention_sec: float = 86400,
+        claim_timeout_sec: float = 60,
+    ):
+        self.publish = publish
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.interval = interval_ms / 1000
+        self.retention_sec = retention_sec
+        self.claim_timeout = timedelta(seconds=claim_timeout_sec)
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = Counter()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def notify(self):
+        self._wakeup.set()
+
+    async def _run(self):
+        next_purge = 0.0
+        while True:
+            if time.monotonic() >= next_purge:
+                await self.purge_sent()
+                next_purge = (
+                    time.monotonic() + self.retention_sec * PURGE_INTERVAL_RATIO
+                )
+            # relay_once 중에 들어온 notify 는 아래 wait 에서 바로 깨운다
+            self._wakeup.clear()
+            try:
+                sent = await self.relay_once()
+            except Exception as e:
+                logging.error(f"❌ outbox 발행 실패: {e}")
+                sent = 0
+            if sent >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def relay_once(self) -> int:
+        """미발행 행을 한 묶음 발행하고 발행한 행 수를 돌려준다"""
+        rows = await self.claim()
+        if not rows:
+            return 0
+
+        # 발행 중에는 트랜잭션을 열어 두지 않는다 (SQLite 단일 writer 연결/쓰기 잠금,
+        # PostgreSQL 행 잠금을 브로커 응답까지 잡고 있으면 결과 저장이 막힌다)
+        # 채널이 publisher confirm 모드이므로 연달아 보내고 확인을 한꺼번에 기다린다
+        results = await asyncio.gather(
+            *(self.publish(row) for row in rows), return_exceptions=True
+        )
+        sent, failed = [], []
+        for row, result in zip(rows, results):
+            (failed if isinstance(result, Exception) else sent).append(row.id)
+        if failed:
+            self.stats["failed"] += len(failed)
+            error = next(r for r in results if isinstance(r, Exception))
+            logging.warning(f"⚠️ outbox 메시지 {len(failed)}건 발행 실패: {error}")
+        await self.finish(sent, failed)
+        self.stats["sent"] += len(sent)
+        self.stats["batches"] += 1
+        return len(sent)
+
+    async def claim(self) -> list[OutboxMessage]:
+        """
+        미발행이고 다른 relay 가 가져가지 않은 행을 claim_timeout_sec 동안 가져간다.
+        발행 확인 전에 relay 가 죽으면 그 시간이 지난 뒤 다시 발행된다.
+        """
+        now = datetime.now(timezone.utc)
+        async with self.session_factory() as session:
+            rows = (
+                await session.scalars(
+                    select(OutboxMessage)
+                    .where(
+                        OutboxMessage.sent_time.is_(None),
+                        or_(
+                            OutboxMessage.claimed_until.is_(None),
+                            OutboxMessage.claimed_until < now,
+                        ),
+                    )
+                    .order_by(OutboxMessage.created_time)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            if rows:
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id.in_([row.id for row in rows]))
+                    .values(claimed_until=now + self.claim_timeout)
+                )
+            await session.commit()
+        return list(rows)
+
+    async def finish(self, sent: list, failed: list):
+        """발행 확인을 받은 행은 완료 처리, 실패한 행은 다음 relay_once 에서 다시 가져가게 한다"""
+        if not sent and not failed:
+            return
+        async with self.session_factory() as session:
+            if sent:
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id.in_(sent))
+                    .values(sent_time=datetime.now(timezone.utc))
+                )
+            if failed:
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id.in_(failed))
+                    .values(claimed_until=None)
+                )
+            await session.commit()
+
+    async def purge_sent(self) -> int:
+        """retention_sec 보다 오래된 발행 완료 행 삭제"""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.retention_sec)
+        try:
+            async with self.session_factory() as session:
+                deleted = await session.execute(
+                    delete(OutboxMessage).where(OutboxMessage.sent_time < cutoff)
+                )
+                await session.commit()
+        except Exception as e:
+            logging.warning(f"⚠️ 발행 완료 outbox 정리 실패: {e}")
+            return 0
+        self.stats["purged"] += deleted.rowcount
+        return deleted.rowcount
+
+    async def close(self, timeout: float = 10.0):
+        """남은 미발행 행을 한 번 더 발행한 뒤 종료 (못 보낸 행은 다음 실행에서 발행)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        try:
+            await asyncio.wait_for(self.relay_once(), timeout)
+        except Exception as e:
+            logging.warning(f"⚠️ 종료 전 outbox 발행 실패: {e}")
+        logging.info(f"📊 outbox 발행 통계: {self.snapshot()}")
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(self.stats)
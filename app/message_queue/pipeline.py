@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+# 다음 단계로 넘길 항목을 반환, None 이면 해당 항목의 처리를 끝낸다
+StageHandler = Callable[[Any], Awaitable[Optional[Any]]]
+
+
+@dataclass
+class StageStats:
+    processed: int = 0
+    failed: int = 0
+    total_wait: float = 0.0
+    total_busy: float = 0.0
+
+    def snapshot(self, queue_depth: int) -> dict:
+        handled = self.processed + self.failed
+        return {
+            "queue_depth": queue_depth,
+            "processed": self.processed,
+            "failed": self.failed,
+            "avg_wait_ms": (
+                round(self.total_wait / handled * 1000, 3) if handled else 0.0
+            ),
+            "avg_busy_ms": (
+                round(self.total_busy / handled * 1000, 3) if handled else 0.0
+            ),
+        }
+
+
+class Stage:
+    def __init__(self, name: str, handler: StageHandler, workers: int, queue_size: int):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue: asyncio.Queue[tuple[Any, float]] = asyncio.Queue(maxsize=queue_size)
+        self.stats = StageStats()
+
+
+class Pipeline:
+    """
+    단계별로 bounded queue 와 워커 수를 가지는 비동기 파이프라인.
+    뒷 단계가 느리면 큐가 차서 앞 단계의 put 이 막히고, 결국 submit 이 막혀
+    ack 되지 않은 메시지가 prefetch 한도를 채우므로 브로커가 전달을 멈춘다.
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        on_done: Callable[[Any], Awaitable[None]],
+        on_error: Callable[[Any, str, Exception], Awaitable[None]],
+    ):
+        self.stages = stages
+        self.on_done = on_done
+        self.on_error = on_error
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def capacity(self) -> int:
+        return sum(stage.queue.maxsize + stage.workers for stage in self.stages)
+
+    def start(self):
+        for index, stage in enumerate(self.stages):
+            next_stage = (
+                self.stages[index + 1] if index + 1 < len(self.stages) else None
+            )
+            for worker_id in range(stage.workers):
+                self._tasks.append(
+                    asyncio.create_task(
+                        self._run_worker(stage, next_stage),
+                        name=f"pipeline-{stage.name}-{worker_id}",
+                    )
+                )
+
+    async def submit(self, item: Any):
+        await self.stages[0].queue.put((item, time.perf_counter()))
+
+    async def _run_worker(self, stage: Stage, next_stage: Optional[Stage]):
+        while True:
+            item, enqueued_at = await stage.queue.get()
+            started_at = time.perf_counter()
+            stage.stats.total_wait += started_at - enqueued_at
+            try:
+                try:
+                    result = await stage.handler(item)
+                finally:
+                    stage.stats.total_busy += time.perf_counter() - started_at
+            except Exception as e:
+                stage.stats.failed += 1
+                await self._call(self.on_error, item, stage.name, e)
+                stage.queue.task_done()
+                continue
+
+            stage.stats.processed += 1
+            # 다음 단계로 넘긴 뒤에 task_done 해야 drain 이 중간에 끝나지 않는다
+            if result is None or next_stage is None:
+                await self._call(self.on_done, item)
+            else:
+                await next_stage.queue.put((result, time.perf_counter()))
+            stage.queue.task_done()
+
+    @staticmethod
+    async def _call(callback: Callable[..., Awaitable[None]], *args):
+        # ack/reject 가 실패해도 (재연결로 닫힌 채널 등) 워커가 죽으면 단계가 멈추므로 로그만 남긴다
+        try:
+            await callback(*args)
+        except Exception as e:
+            logging.error(
+                f"❌ 파이프라인 콜백 실패 ({getattr(callback, "__name__", callback)}): {e}"
+            )
+
+    def stats(self) -> dict[str, dict]:
+        return {
+            stage.name: stage.stats.snapshot(stage.queue.qsize())
+            for stage in self.stages
+        }
+
+    async def log_stats(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            logging.info(f"📊 파이프라인 상태: {self.stats()}")
+
+    async def drain(self, timeout: float):
+        # 단계 순서대로 큐가 비기를 기다린다
+        try:
+            async with asyncio.timeout(timeout):
+                for stage in self.stages:
+                    await stage.queue.join()
+        except TimeoutError:
+            logging.warning("⚠️ 파이프라인 종료 대기 시간 초과")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
@@ -1,9 +1,9 @@
-from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Optional
 
+import msgspec
 
-@dataclass
-class PublishMessageHeader:
+
+class PublishMessageHeader(msgspec.Struct):
     event_id: str
     event_type: Literal["image.validation.result"]
     trace_id: str
@@ -11,14 +11,32 @@ class PublishMessageHeader:
     source_service: str
 
 
-@dataclass
-class ValidationServiceData:
+class ValidationServiceData(msgspec.Struct):
     is_blank: bool
+    # blank 이미지는 접힘 검사를 건너뛰므로 None
+    is_folded: Optional[bool] = None
+    tilt_angle: Optional[float] = None
 
 
-@dataclass
-class PublishMessageBody:
+class PublishMessageBody(msgspec.Struct):
     gid: str
     status: Literal["success", "fail"]
     completed_at: str
     payload: ValidationServiceData
+    # 마감 시간 때문에 생략/저해상도로 실행한 검출기가 있으면 partial
+    partial: bool = False
+    skipped_detectors: list[str] = msgspec.field(default_factory=list)
+    degraded_detectors: list[str] = msgspec.field(default_factory=list)
+    # 이전 결과를 재사용했으면 "cache", "near_duplicate" 또는 "single_flight"
+    reused_from: Optional[str] = None
+
+
+_body_encoder = msgspec.json.Encoder()
+
+
+def encode_body(body: PublishMessageBody) -> bytes:
+    return _body_encoder.encode(body)
+
+
+def header_to_dict(header: PublishMessageHeader) -> dict:
+    return msgspec.structs.asdict(header)
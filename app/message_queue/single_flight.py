@@ -0,0 +1,60 @@
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    같은 key 의 작업이 진행 중이면 새로 시작하지 않고 그 결과를 함께 기다린다.
+    결과 (또는 예외) 는 진행 중이던 호출자들에게만 공유되고 저장되지 않는다.
+    """
+
+    def __init__(self):
+        self._flights: dict[Hashable, _Flight] = {}
+        self.stats = Counter()
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(
+        self, key: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """(결과, 다른 호출의 결과를 공유받았는지)"""
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight.followers += 1
+            self.stats["shared"] += 1
+            # 기다리던 쪽이 취소되어도 진행 중인 작업은 취소하지 않는다
+            return await asyncio.shield(flight.future), True
+
+        flight = _Flight(asyncio.get_running_loop().create_future())
+        self._flights[key] = flight
+        self.stats["executed"] += 1
+        try:
+            result = await func()
+        except Exception as e:
+            flight.future.set_exception(e)
+            if not flight.followers:
+                # 기다리는 쪽이 없으면 읽어 둬서 "예외를 꺼내지 않음" 경고를 막는다
+                flight.future.exception()
+            raise
+        except BaseException:
+            # 취소되면 기다리던 쪽도 취소된다
+            flight.future.cancel()
+            raise
+        else:
+            flight.future.set_result(result)
+            return result, False
+        finally:
+            del self._flights[key]
+
+    def snapshot(self) -> dict[str, int]:
+        return {"in_flight": len(self._flights), **self.stats}
@@ -0,0 +1,37 @@
+import io
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from aio_pika.abc import AbstractIncomingMessage
+
+from app.message_queue.consume_message import (
+    ConsumeMessageHeader,
+    ConsumeMessagePayload,
+)
+from app.service.validation_result import ValidationResult
+
+
+@dataclass
+class WorkItem:
+    """메시지 하나가 처리 단계를 거치며 채워지는 상태"""
+
+    message: AbstractIncomingMessage
+    message_received_time: datetime
+    header: Optional[ConsumeMessageHeader] = None
+    payload: Optional[ConsumeMessagePayload] = None
+    file_obj: Optional[io.BytesIO] = None
+    image: Optional[np.ndarray] = None
+    file_received_time: Optional[datetime] = None
+    validation_result: Optional[ValidationResult] = None
+    # 마감 시각 (time.time() 기준), 지난 메시지는 처리하지 않고 dead letter 로 보낸다
+    deadline: Optional[float] = None
+    expired: bool = False
+    # 결과 캐시 키 (ETag 키, 내용 해시 키 순서) 와 HEAD 로 받은 ETag
+    etag: Optional[str] = None
+    cache_keys: list[str] = field(default_factory=list)
+    # 유사 이미지 색인용 dHash (저대비 이미지이거나 색인을 쓰지 않으면 None)
+    perceptual_hash: Optional[int] = None
+    # 저장까지 끝난 이벤트의 재전달 (저장하지 않고, outbox 모드가 아니면 발행만 다시 한다)
+    replayed: bool = False
@@ -1,8 +0,0 @@
-from abc import ABC, abstractmethod
-
-
-class Detector(ABC):
-
-    @abstractmethod
-    def validate(self, image):
-        pass
@@ -1,19 +1,184 @@
+import threading
+
+import cv2
 import numpy as np
 
-from app.service.utils.gray_filter import gray_filter_np
+from app.service.detector.detector import Detector
+from app.service.image_context import ImageContext
+
 
+class BlankDetector(Detector):
+    outputs = ("is_blank",)
+    cost = 1.0
 
-class BlankDetector:
-    def __init__(self, bin_threshold=150, blank_threshold_ratio=0.99999):
+    def __init__(
+        self,
+        bin_threshold=150,
+        blank_threshold_ratio=0.99999,
+        min_pixels=0,
+        early_exit=True,
+        block_rows=256,
+        sample_stride=8,
+        batch_max_pixels=1 << 20,
+    ):
         self.bin_threshold = bin_threshold
         self.blank_threshold_ratio = blank_threshold_ratio
+        self.min_pixels = min_pixels
+        # 블록 단위로 세다가 어두운 픽셀이 허용치를 넘으면 바로 중단 (결과는 전체 스캔과 동일)
+        self.early_exit = early_exit
+        self.block_rows = block_rows
+        # 전체 스캔 전에 stride 간격 샘플만 먼저 확인 (0, 1 이면 사용 안 함)
+        self.sample_stride = sample_stride
+        # validate_batch 에서 한 버퍼로 묶는 최대 픽셀 수 (CPU 캐시에 들어가는 정도)
+        self.batch_max_pixels = batch_max_pixels
+        # 스레드 풀에서 공유될 수 있으므로 작업 버퍼는 스레드별로 둔다
+        self._local = threading.local()
 
-    def validate(self, image):
-        is_blank = self.is_blank_image(image)
+    def validate(self, context: ImageContext):
+        is_blank = self.is_blank_image(self.source_image(context))
         return {"is_blank": is_blank}
 
+    def validate_batch(self, contexts: list[ImageContext]) -> list[dict]:
+        """
+        작은 이미지들은 하나의 버퍼에 이어 붙여 이진화를 한 번에 하고,
+        크기가 같으면 흰 픽셀 합계도 reduce 한 번으로 구한다.
+        batch_max_pixels 보다 큰 이미지는 캐시 밖으로 밀려나 오히려 느려지므로 이미지 단위로 센다.
+        """
+        images = [self.source_image(context) for context in contexts]
+        if any(image.dtype != np.uint8 for image in images):
+            return super().validate_batch(contexts)
+
+        is_blank = [False] * len(images)
+        group, group_pixels = [], 0
+        for index, image in enumerate(images):
+            pixels = image.shape[0] * image.shape[1]
+            max_dark = self.max_dark_pixels(pixels)
+            if max_dark < 0:
+                continue
+            if pixels > self.batch_max_pixels:
+                is_blank[index] = self.is_blank_image(image)
+                continue
+            if group and group_pixels + pixels > self.batch_max_pixels:
+                self._validate_group(images, group, is_blank)
+                group, group_pixels = [], 0
+            group.append(index)
+            group_pixels += pixels
+        if group:
+            self._validate_group(images, group, is_blank)
+        return [{"is_blank": value} for value in is_blank]
+
+    def _validate_group(
+        self, images: list[np.ndarray], group: list[int], is_blank: list[bool]
+    ):
+        sizes = [images[i].shape[0] * images[i].shape[1] for i in group]
+        offsets = np.cumsum([0] + sizes[:-1])
+        buffer = self._get_buffer((1, sum(sizes)))
+        for index, start, size in zip(group, offsets, sizes):
+            image = images[index]
+            target = buffer[0, start : start + size].reshape(image.shape[:2])
+            if image.ndim == 3:
+                cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=target)
+            else:
+                np.copyto(target, image)
+        # 255 대신 1 로 이진화해서 행 합계가 곧 흰 픽셀 수가 되도록 한다
+        cv2.threshold(buffer, self.bin_threshold, 1, cv2.THRESH_BINARY, dst=buffer)
+        if len(set(sizes)) == 1:
+            # 크기가 같으면 (이미지 수, 픽셀 수) 로 보고 reduce 한 번으로 센다
+            white_counts = cv2.reduce(
+                buffer.reshape(len(sizes), sizes[0]),
+                1,
+                cv2.REDUCE_SUM,
+                dtype=cv2.CV_32S,
+            ).ravel()
+        else:
+            white_counts = [
+                cv2.countNonZero(buffer[0, start : start + size])
+                for start, size in zip(offsets, sizes)
+            ]
+        for index, white, size in zip(group, white_counts, sizes):
+            is_blank[index] = int(white) / size >= self.blank_threshold_ratio
+
+    @staticmethod
+    def source_image(context: ImageContext) -> np.ndarray:
+        # 다른 검출기가 이미 gray 를 만들어 뒀으면 그것을 쓰고, 아니면 원본에서 직접 센다
+        image = context.cached_gray()
+        return image if image is not None else context.image
+
     def is_blank_image(self, image: np.ndarray) -> bool:
-        gray_image = gray_filter_np(image)
-        binary_image = gray_image > self.bin_threshold
-        white_pixel_ratio = np.mean(binary_image)
+        if self.early_exit:
+            return self.is_blank_image_early_exit(image)
+        # np.mean(gray > threshold) >= ratio 와 같은 계산 (정수 개수 / 전체 픽셀 수)
+        white_pixel_ratio = self.count_white_pixels(image) / (
+            image.shape[0] * image.shape[1]
+        )
         return white_pixel_ratio >= self.blank_threshold_ratio
+
+    def is_blank_image_early_exit(self, image: np.ndarray) -> bool:
+        height, width = image.shape[:2]
+        max_dark = self.max_dark_pixels(height * width)
+        if max_dark < 0:
+            return False
+
+        if self.sample_rejects(image, max_dark):
+            return False
+
+        dark = 0
+        for start in range(0, height, self.block_rows):
+            block = image[start : start + self.block_rows]
+            dark += block.shape[0] * width - self.count_white_pixels(block)
+            if dark > max_dark:
+                return False
+        return True
+
+    def sample_rejects(self, image: np.ndarray, max_dark: int) -> bool:
+        """
+        샘플의 어두운 픽셀은 전체 이미지의 어두운 픽셀이기도 하므로
+        샘플만으로 허용치를 넘으면 blank 가 아님이 확정된다 (오차 없음)
+        """
+        if self.sample_stride <= 1:
+            return False
+        sample = image[:: self.sample_stride, :: self.sample_stride]
+        sample_dark = sample.shape[0] * sample.shape[1] - self.count_white_pixels(
+            sample
+        )
+        return sample_dark > max_dark
+
+    def max_dark_pixels(self, total: int) -> int:
+        """
+        (total - dark) / total >= ratio 를 만족하는 최대 dark 개수.
+        is_blank_image 와 같은 부동소수 비교로 경계를 맞춘다. 불가능하면 -1.
+        """
+        dark = min(max(int(total * (1 - self.blank_threshold_ratio)), 0), total)
+        while dark >= 0 and (total - dark) / total < self.blank_threshold_ratio:
+            dark -= 1
+        while dark < total and (total - dark - 1) / total >= self.blank_threshold_ratio:
+            dark += 1
+        return dark
+
+    def count_white_pixels(self, image: np.ndarray) -> int:
+        """
+        gray 변환 → 이진화 → 개수 세기를 재사용 버퍼 하나 위에서 처리한다.
+        gray 이미지나 bool 배열, float64 평균을 따로 만들지 않는다.
+        """
+        if image.dtype != np.uint8:
+            gray_image = (
+                image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            )
+            return int(np.count_nonzero(gray_image > self.bin_threshold))
+
+        buffer = self._get_buffer(image.shape[:2])
+        source = image
+        if image.ndim == 3:
+            cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=buffer)
+            source = buffer
+        cv2.threshold(source, self.bin_threshold, 255, cv2.THRESH_BINARY, dst=buffer)
+        return cv2.countNonZero(buffer)
+
+    def _get_buffer(self, shape: tuple[int, int]) -> np.ndarray:
+        # 블록/샘플마다 크기가 달라도 가장 큰 버퍼의 앞부분을 잘라 쓴다
+        size = shape[0] * shape[1]
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=np.uint8)
+            self._local.buffer = buffer
+        return buffer[:size].reshape(shape)
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from app.service.image_context import ImageContext
+
+
+class Detector(ABC):
+    # 검출기가 받아들이는 최소 해상도 (픽셀 수), 0 이면 축소 디코딩 제한 없음
+    min_pixels: int = 0
+    # 컬러 정보가 필요한지 여부, 모든 검출기가 False 면 grayscale 로 디코딩
+    requires_color: bool = False
+
+    # 실행 계획용 선언: 만드는 결과 필드, 상대 비용, 건너뛸 조건 ({결과 필드: 값})
+    outputs: tuple[str, ...] = ()
+    cost: float = 1.0
+    skip_if: dict[str, Any] = {}
+
+    # 마감 시간 대응: 예상 최대 실행 시간 (ms, 0 이면 모름) 과 생략 가능 여부
+    budget_ms: float = 0.0
+    optional: bool = False
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    @abstractmethod
+    def validate(self, context: ImageContext) -> dict:
+        """context 의 gray/피라미드/엣지 등 공유 계산 결과를 사용해 결과 dict 를 반환"""
+        pass
+
+    def budget_for(self, context: ImageContext) -> float:
+        """이 이미지에서의 예상 최대 실행 시간 (ms), 공유 계산을 새로 해야 하면 그 시간도 포함"""
+        return self.budget_ms
+
+    def coarse(self) -> Optional["Detector"]:
+        """시간이 부족할 때 대신 실행할 낮은 해상도 버전 (없으면 None)"""
+        return None
+
+    def validate_batch(self, contexts: list[ImageContext]) -> list[dict]:
+        """
+        여러 이미지를 한 번에 검증해 context 순서대로 결과 dict 를 반환.
+        기본 구현은 이미지마다 validate 를 호출하며, 벡터화할 수 있는 검출기만 재정의한다.
+        """
+        return [self.validate(context) for context in contexts]
@@ -0,0 +1,176 @@
+import copy
+import math
+
+import cv2
+import numpy as np
+import shapely
+from shapely.geometry import LineString, box
+
+from app.service.detector.detector import Detector
+from app.service.image_context import ImageContext
+
+
+class FoldDetector(Detector):
+    """
+    접힌 자국: 페이지를 가로지르는 길고 곧은 엣지.
+    픽셀 예산으로 축소한 엣지 맵에서 확률적 Hough 로 선분을 찾고,
+    shapely 로 테두리 선분을 걸러내고 후보 직선을 페이지에 잘라 현(chord)을 만든 뒤,
+    현을 따라 엣지가 페이지 끝에서 끝까지 이어지는지 확인한다.
+    """
+
+    outputs = ("is_folded",)
+    cost = 5.0
+    skip_if = {"is_blank": True}
+    # 축소된 엣지 맵에서의 검출 시간, 원본에서 축소하는 시간은 budget_for 에서 더한다
+    budget_ms = 40.0
+    optional = True
+
+    def __init__(
+        self,
+        pixel_budget=250_000,
+        canny_low=50,
+        canny_high=150,
+        hough_threshold=80,
+        angle_resolution_deg=2.0,
+        min_segment_ratio=0.2,
+        max_gap_ratio=0.02,
+        angle_tolerance_deg=2.0,
+        distance_tolerance_ratio=0.01,
+        border_margin_ratio=0.03,
+        min_span_ratio=0.5,
+        min_coverage=0.6,
+        end_margin_ratio=0.05,
+    ):
+        self.pixel_budget = pixel_budget
+        # 축소 디코딩 시에도 검출 해상도를 유지하도록 픽셀 예산을 최소 해상도로 선언
+        self.min_pixels = pixel_budget
+        self.canny_low = canny_low
+        self.canny_high = canny_high
+        self.hough_threshold = hough_threshold
+        # Hough 각도 해상도: 투표 비용이 이에 반비례 (후보 검증은 엣지 맵에서 따로 한다)
+        self.angle_resolution = math.radians(angle_resolution_deg)
+        # 길이/거리 기준은 축소된 이미지의 짧은 변에 대한 비율
+        self.min_segment_ratio = min_segment_ratio
+        self.max_gap_ratio = max_gap_ratio
+        self.angle_tolerance = math.radians(angle_tolerance_deg)
+        self.distance_tolerance_ratio = distance_tolerance_ratio
+        self.border_margin_ratio = border_margin_ratio
+        # 페이지를 가로지르는 현의 최소 길이와 현을 따라 엣지가 있는 최소 비율
+        self.min_span_ratio = min_span_ratio
+        self.min_coverage = min_coverage
+        # 현의 양 끝에서 이 비율 구간 안에 엣지가 있어야 페이지를 가로지른 것으로 본다
+        self.end_margin_ratio = end_margin_ratio
+
+    def coarse(self) -> "FoldDetector":
+        # 픽셀 예산 1/4 (한 변 1/2) 로 같은 검출을 한다
+        coarse = copy.copy(self)
+        coarse.pixel_budget = coarse.min_pixels = self.pixel_budget // 4
+        coarse.budget_ms = 20.0
+        return coarse
+
+    def budget_for(self, context: ImageContext) -> float:
+        return self.budget_ms + context.downscale_cost_ms(self.pixel_budget)
+
+    def validate(self, context: ImageContext):
+        edges = context.edges(self.pixel_budget, self.canny_low, self.canny_high)
+        return {"is_folded": len(self.find_fold_lines(edges)) > 0}
+
+    def find_fold_lines(self, edges: np.ndarray) -> list[LineString]:
+        height, width = edges.shape
+        short_side = min(height, width)
+        segments = cv2.HoughLinesP(
+            edges,
+            rho=1,
+            theta=self.angle_resolution,
+            threshold=self.hough_threshold,
+            minLineLength=max(int(short_side * self.min_segment_ratio), 1),
+            maxLineGap=max(int(short_side * self.max_gap_ratio), 1),
+        )
+        if segments is None:
+            return []
+        segments = segments.reshape(-1, 4).astype(float)
+
+        page = box(0, 0, width - 1, height - 1)
+        # 스캔 테두리/그림자는 접힌 자국이 아니므로 테두리 근처 선분은 제외
+        border_zone = page.exterior.buffer(short_side * self.border_margin_ratio)
+        shapely.prepare(border_zone)
+        near_border = shapely.contains(
+            border_zone, shapely.linestrings(segments.reshape(-1, 2, 2))
+        )
+        segments = segments[~near_border]
+
+        if len(segments) == 0:
+            return []
+
+        lines = self.cluster_lines(
+            segments, max(short_side * self.distance_tolerance_ratio, 1.0)
+        )
+
+        # 후보 직선을 페이지 사각형으로 잘라 현(chord)을 만든다
+        thetas, rhos = lines[:, 0], lines[:, 1]
+        directions = np.stack([np.cos(thetas), np.sin(thetas)], axis=1)
+        origins = np.stack([-rhos * directions[:, 1], rhos * directions[:, 0]], axis=1)
+        diagonal = math.hypot(width, height)
+        infinite_lines = shapely.linestrings(
+            np.stack(
+                [origins - directions * diagonal, origins + directions * diagonal],
+                axis=1,
+            )
+        )
+        chords = shapely.intersection(page, infinite_lines)
+        chords = chords[
+            ~shapely.is_empty(chords)
+            & (shapely.length(chords) >= short_side * self.min_span_ratio)
+        ]
+        if len(chords) == 0:
+            return []
+
+        # 선분이 끊겨 검출돼도 원래 엣지 맵에서 현을 따라 지지 비율을 잰다
+        support = cv2.dilate(edges, np.ones((3, 3), np.uint8))
+        crossing = self.crosses_page(support, chords)
+        return list(chords[crossing])
+
+    def cluster_lines(
+        self, segments: np.ndarray, distance_tolerance: float
+    ) -> np.ndarray:
+        """선분을 (theta, rho) 격자로 묶어 같은 직선 위의 선분을 하나의 후보 직선으로 만든다"""
+        x1, y1, x2, y2 = segments.T
+        thetas = np.arctan2(y2 - y1, x2 - x1) % np.pi
+        # pi 근처는 0 근처와 같은 방향: 방향을 뒤집으면 rho 부호도 뒤집힌다
+        wrap = thetas > np.pi - self.angle_tolerance
+        thetas[wrap] -= np.pi
+        rhos = -x1 * np.sin(thetas) + y1 * np.cos(thetas)
+
+        keys = np.stack(
+            [
+                np.round(thetas / self.angle_tolerance),
+                np.round(rhos / distance_tolerance),
+            ],
+            axis=1,
+        )
+        # 같은 격자 칸의 선분은 하나의 후보로, 칸마다 평균 직선을 쓴다
+        _, inverse, counts = np.unique(
+            keys, axis=0, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.ravel()
+        theta_sum = np.bincount(inverse, weights=thetas)
+        rho_sum = np.bincount(inverse, weights=rhos)
+        return np.stack([theta_sum / counts, rho_sum / counts], axis=1)
+
+    def crosses_page(self, support: np.ndarray, chords: np.ndarray) -> np.ndarray:
+        """각 현을 따라 엣지가 충분히 이어지고 양 끝 (페이지 테두리) 근처까지 닿는지"""
+        samples = max(support.shape)
+        coords = shapely.get_coordinates(chords).reshape(-1, 2, 2)
+        steps = np.linspace(0.0, 1.0, samples)
+        points = coords[:, :1] + (coords[:, 1:] - coords[:, :1]) * steps[None, :, None]
+        xs = points[..., 0].round().astype(np.intp)
+        ys = points[..., 1].round().astype(np.intp)
+        hits = support[ys, xs] > 0
+
+        # 본문 줄/표 테두리와 구분: 양 끝 구간에도 엣지가 있어야 한다
+        end = max(int(samples * self.end_margin_ratio), 1)
+        return (
+            (hits.mean(axis=1) >= self.min_coverage)
+            & hits[:, :end].any(axis=1)
+            & hits[:, -end:].any(axis=1)
+        )
@@ -0,0 +1,93 @@
+import copy
+
+import cv2
+import numpy as np
+from deskew import determine_skew
+
+from app.service.detector.detector import Detector
+from app.service.image_context import ImageContext
+
+
+class TiltDetector(Detector):
+    """
+    기울기 (도 단위, deskew 규약: 이 각도만큼 반시계 방향으로 회전하면 바로 선다).
+    픽셀 예산으로 축소한 이진화 이미지에서 deskew 로 거친 각도를 구하고,
+    선택적으로 그 주변을 투영 프로파일 분산으로 세밀하게 다시 찾는다.
+    """
+
+    outputs = ("tilt_angle",)
+    cost = 8.0
+    skip_if = {"is_blank": True}
+    budget_ms = 150.0
+    optional = True
+
+    def __init__(
+        self,
+        pixel_budget=250_000,
+        max_angle=15.0,
+        coarse_resolution=1.0,
+        refine=True,
+        fine_resolution=0.1,
+        sigma=3.0,
+    ):
+        self.pixel_budget = pixel_budget
+        self.min_pixels = pixel_budget
+        # 탐색 범위 [-max_angle, max_angle] 와 거친/세밀 탐색 간격 (도)
+        self.max_angle = max_angle
+        self.coarse_resolution = coarse_resolution
+        self.refine = refine
+        self.fine_resolution = fine_resolution
+        self.sigma = sigma
+
+    def coarse(self) -> "TiltDetector":
+        # 픽셀 예산 1/4 (한 변 1/2) 로 같은 검출을 한다
+        coarse = copy.copy(self)
+        coarse.pixel_budget = coarse.min_pixels = self.pixel_budget // 4
+        coarse.budget_ms = 40.0
+        return coarse
+
+    def budget_for(self, context: ImageContext) -> float:
+        return self.budget_ms + context.downscale_cost_ms(self.pixel_budget)
+
+    def validate(self, context: ImageContext):
+        return {
+            "tilt_angle": self.estimate_angle(context.downscaled(self.pixel_budget))
+        }
+
+    def estimate_angle(self, gray: np.ndarray):
+        # 글자 = 255, 배경 = 0 으로 이진화 (회전 시 바깥 영역도 0 으로 채워진다)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        angle = determine_skew(
+            binary,
+            sigma=self.sigma,
+            min_deviation=self.coarse_resolution,
+            min_angle=-self.max_angle,
+            max_angle=self.max_angle,
+        )
+        if angle is None:
+            return None
+        if self.refine:
+            angle = self.refine_angle(binary, float(angle))
+        return round(float(angle), 2)
+
+    def refine_angle(self, binary: np.ndarray, coarse_angle: float) -> float:
+        """거친 각도 ± 해상도 구간에서 행 투영 프로파일의 분산이 최대인 각도"""
+        height, width = binary.shape
+        center = (width / 2, height / 2)
+        candidates = np.arange(
+            coarse_angle - self.coarse_resolution,
+            coarse_angle + self.coarse_resolution + self.fine_resolution / 2,
+            self.fine_resolution,
+        )
+        best_angle, best_score = coarse_angle, -1.0
+        for candidate in candidates:
+            matrix = cv2.getRotationMatrix2D(center, float(candidate), 1.0)
+            rotated = cv2.warpAffine(
+                binary, matrix, (width, height), flags=cv2.INTER_NEAREST
+            )
+            score = float(
+                np.var(cv2.reduce(rotated, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32F))
+            )
+            if score > best_score:
+                best_angle, best_score = float(candidate), score
+        return best_angle
@@ -0,0 +1,8 @@
+from app.service.detector.blank_detector import BlankDetector
+from app.service.detector.fold_detector import FoldDetector
+from app.service.detector.tilt_detector import TiltDetector
+
+
+def build_detectors() -> list:
+    # 워커 프로세스에서도 호출되므로 모듈 최상위 함수로 둔다 (pickle 가능해야 함)
+    return [BlankDetector(), FoldDetector(), TiltDetector()]
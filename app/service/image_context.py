@@ -0,0 +1,105 @@
+from functools import cached_property
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from app.service.utils.gray_filter import gray_filter_np
+
+# 원본에서 축소 gray 를 만드는 예상 시간 (원본 백만 픽셀당 ms, 600DPI A4 기준 측정값에 여유)
+DOWNSCALE_MS_PER_MEGAPIXEL = {"gray": 0.75, "color": 1.5}
+
+
+class ImageContext:
+    """
+    검출기들이 공유하는 이미지 단위 계산 결과.
+    각 값은 처음 접근할 때 계산되고 같은 이미지를 검증하는 동안만 재사용된다.
+    """
+
+    def __init__(self, image: np.ndarray):
+        self.image = image
+        self._pyramid: dict[int, np.ndarray] = {}
+        self._edges: dict[tuple[int, int, int], np.ndarray] = {}
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.image.shape[:2]
+
+    @property
+    def pixels(self) -> int:
+        return self.image.shape[0] * self.image.shape[1]
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        return gray_filter_np(self.image)
+
+    def cached_gray(self) -> Optional[np.ndarray]:
+        # 이미 계산된 경우에만 반환 (새로 만들지 않음)
+        if self.image.ndim == 2:
+            return self.image
+        return self.__dict__.get("gray")
+
+    def pyramid(self, level: int) -> np.ndarray:
+        """
+        gray 를 2^level 배 축소한 이미지 (level 0 은 원본 gray).
+        원본 해상도 gray 나 중간 단계를 만들지 않고 원본에서 한 번에 INTER_AREA 로 줄인다
+        (600DPI 컬러 페이지에서 원본 gray + 단계별 축소는 100ms 이상 걸린다).
+        """
+        if level == 0:
+            return self.gray
+        if level not in self._pyramid:
+            source = self.cached_gray()
+            if source is None:
+                source = self.image
+            # 정수 배율이면 INTER_AREA 가 빠른 경로를 타므로 2^level 의 배수로 자른다
+            factor = 1 << level
+            height, width = source.shape[:2]
+            height, width = max(height // factor, 1), max(width // factor, 1)
+            source = source[: height * factor, : width * factor]
+            self._pyramid[level] = gray_filter_np(
+                cv2.resize(source, (width, height), interpolation=cv2.INTER_AREA)
+            )
+        return self._pyramid[level]
+
+    def level_for(self, max_pixels: int) -> int:
+        """픽셀 수가 max_pixels 이하가 되는 가장 낮은 피라미드 레벨"""
+        level = 0
+        pixels = self.pixels
+        while max_pixels > 0 and pixels > max_pixels and pixels >= 4:
+            pixels //= 4
+            level += 1
+        return level
+
+    def downscaled(self, max_pixels: int) -> np.ndarray:
+        return self.pyramid(self.level_for(max_pixels))
+
+    def downscale_cost_ms(self, max_pixels: int) -> float:
+        """downscaled(max_pixels) 를 아직 만들지 않았으면 만드는 데 걸릴 예상 시간"""
+        level = self.level_for(max_pixels)
+        gray = self.cached_gray()
+        if level in self._pyramid or (level == 0 and gray is not None):
+            return 0.0
+        kind = "color" if gray is None else "gray"
+        return self.pixels / 1e6 * DOWNSCALE_MS_PER_MEGAPIXEL[kind]
+
+    @cached_property
+    def histogram(self) -> np.ndarray:
+        return cv2.calcHist([self.gray], [0], None, [256], [0, 256]).ravel()
+
+    def edges(
+        self, max_pixels: int, low_threshold: int = 50, high_threshold: int = 150
+    ) -> np.ndarray:
+        """축소 gray 위의 Canny 엣지 맵"""
+        key = (self.level_for(max_pixels), low_threshold, high_threshold)
+        if key not in self._edges:
+            self._edges[key] = cv2.Canny(
+                self.pyramid(key[0]), low_threshold, high_threshold
+            )
+        return self._edges[key]
+
+    def release(self):
+        self.__dict__.pop("gray", None)
+        self.__dict__.pop("histogram", None)
+        self._pyramid.clear()
+        self._edges.clear()
+        self.image = None
@@ -0,0 +1,133 @@
+import math
+from collections import OrderedDict
+from itertools import combinations
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from app.service.validation_result import ValidationResult
+
+
+def dhash(image: np.ndarray, hash_size: int = 8, sample_pixels: int = 65536) -> int:
+    """
+    difference hash (hash_size² 비트): 축소한 gray 에서 가로로 이웃한 픽셀의 밝기 비교.
+    원본 전체에 INTER_AREA 를 쓰면 느리므로 stride 샘플 (약 sample_pixels 픽셀) 을 먼저 뽑는다.
+    """
+    height, width = image.shape[:2]
+    stride = max(1, int(math.sqrt(height * width / sample_pixels)))
+    sample = np.ascontiguousarray(image[::stride, ::stride])
+    if sample.ndim == 3:
+        sample = cv2.cvtColor(sample, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(
+        sample, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA
+    ).astype(np.int16)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def contrast(image: np.ndarray, sample_pixels: int = 4096) -> float:
+    """
+    밝기 표준편차 (샘플). 거의 빈 페이지의 dHash 는 노이즈로 정해지므로
+    이 값이 낮은 이미지는 색인하지 않는다.
+    """
+    height, width = image.shape[:2]
+    stride = max(1, int(math.sqrt(height * width / sample_pixels)))
+    sample = image[::stride, ::stride]
+    if sample.ndim == 3:
+        sample = cv2.cvtColor(np.ascontiguousarray(sample), cv2.COLOR_BGR2GRAY)
+    return float(sample.std())
+
+
+class NearDuplicateIndex:
+    """
+    지각 해시 → 검증 결과, 해밍 거리 max_distance 이내를 찾는 multi-index hashing 색인.
+
+    hash_bits 비트 해시를 chunks 개 조각으로 나누면, 거리 r 이내인 두 해시는
+    적어도 한 조각이 r // chunks 이내로 같다 (비둘기집). 조각마다 dict 를 두고
+    그 반경 안의 조각 값만 조회한 뒤 후보의 전체 거리를 확인한다.
+    조각 크기를 log2(max_entries) 정도로 두면 조각 값마다 후보가 1개 안팎이 된다.
+    항목 수가 max_entries 를 넘으면 가장 오래 쓰이지 않은 항목부터 지운다.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = 3,
+        max_entries: int = 100_000,
+        hash_bits: int = 64,
+        chunks: Optional[int] = None,
+    ):
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        if chunks is None:
+            chunks = round(hash_bits / math.log2(max(max_entries, 2)))
+        self.chunks = min(max(chunks, 1), hash_bits)
+
+        # 조각 (시작 비트, 마스크), 나누어떨어지지 않으면 앞 조각이 1비트씩 더 크다
+        base, extra = divmod(hash_bits, self.chunks)
+        self._chunk_spans = []
+        start = 0
+        for index in range(self.chunks):
+            bits = base + (1 if index < extra else 0)
+            self._chunk_spans.append((start, (1 << bits) - 1))
+            start += bits
+
+        # 조각마다 뒤집어 볼 비트 마스크 (반경 max_distance // chunks 이내)
+        sub_radius = max_distance // self.chunks
+        self._flips = [
+            [
+                sum(1 << bit for bit in bits)
+                for radius in range(sub_radius + 1)
+                for bits in combinations(range(mask.bit_length()), radius)
+            ]
+            for _, mask in self._chunk_spans
+        ]
+
+        self._entries: OrderedDict[int, ValidationResult] = OrderedDict()
+        self._tables: list[dict[int, set[int]]] = [{} for _ in range(self.chunks)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _split(self, value: int) -> list[int]:
+        return [(value >> start) & mask for start, mask in self._chunk_spans]
+
+    def lookup(self, value: int) -> Optional[tuple[ValidationResult, int]]:
+        """가장 가까운 항목의 (결과, 거리), max_distance 이내가 없으면 None"""
+        best, best_distance = None, self.max_distance + 1
+        seen = set()
+        for table, flips, chunk in zip(self._tables, self._flips, self._split(value)):
+            for flip in flips:
+                bucket = table.get(chunk ^ flip)
+                if not bucket:
+                    continue
+                for candidate in bucket - seen:
+                    distance = (candidate ^ value).bit_count()
+                    if distance < best_distance:
+                        best, best_distance = candidate, distance
+                seen |= bucket
+            if best_distance == 0:
+                break
+        if best is None:
+            return None
+        self._entries.move_to_end(best)
+        return self._entries[best], best_distance
+
+    def add(self, value: int, result: ValidationResult):
+        if value in self._entries:
+            self._entries[value] = result
+            self._entries.move_to_end(value)
+            return
+        self._entries[value] = result
+        for table, chunk in zip(self._tables, self._split(value)):
+            table.setdefault(chunk, set()).add(value)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, value: int):
+        del self._entries[value]
+        for table, chunk in zip(self._tables, self._split(value)):
+            bucket = table[chunk]
+            bucket.discard(value)
+            if not bucket:
+                del table[chunk]
@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import msgspec
+from sqlalchemy import delete
+
+from app.db.database import AsyncSessionLocal, WriterSessionLocal
+from app.db.models import ValidationResultCache
+from app.service.validation_result import ValidationResult
+
+
+def detector_config_version(detectors: list) -> str:
+    """
+    검출기 종류/순서와 설정 값으로 만든 버전 문자열.
+    임계값 등을 바꾸면 버전이 달라져 이전 결과를 재사용하지 않는다.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for detector in detectors:
+        params = {
+            key: value
+            for key, value in sorted(vars(detector).items())
+            if not key.startswith("_")
+        }
+        digest.update(f"{type(detector).__name__}{params!r};".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    검증 결과 캐시.
+    키는 (bucket, key, ETag) 또는 다운로드한 바이트의 해시 + 검출기 설정 버전이다.
+
+    - 메모리: LRU, 항목 수 상한과 TTL
+    - DB (persistent=True): 재시작/다른 워커와 공유, 메모리에 없을 때만 조회
+    """
+
+    def __init__(
+        self,
+        config_version: str,
+        max_entries: int = 10000,
+        ttl_sec: float = 3600,
+        persistent: bool = False,
+    ):
+        self.config_version = config_version
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self.persistent = persistent
+
+        # key → (저장 시각 monotonic, 결과)
+        self._entries: OrderedDict[str, tuple[float, ValidationResult]] = OrderedDict()
+        self.stats = Counter()
+
+    def etag_key(self, bucket: str, key: str, etag: str) -> str:
+        # 객체 키 길이와 관계없이 key 컬럼 (String(160)) 에 들어가도록 해시한다
+        digest = hashlib.blake2b(
+            f"{bucket}/{key}:{etag}".encode(), digest_size=16
+        ).hexdigest()
+        return f"etag:{self.config_version}:{digest}"
+
+    def content_key(self, data) -> str:
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return f"blake2b:{self.config_version}:{digest}"
+
+    async def get(self, *keys: str) -> Optional[ValidationResult]:
+        """keys 를 순서대로 찾고, 찾으면 나머지 키에도 채워 넣는다"""
+        for index, key in enumerate(keys):
+            result = self._get_memory(key)
+            if result is None and self.persistent:
+                result = await self._get_persistent(key)
+                if result is not None:
+                    self.stats["persistent_hit"] += 1
+            if result is not None:
+                self.stats["hit"] += 1
+                others = keys[:index] + keys[index + 1 :]
+                for other in (key, *others):
+                    self._put_memory(other, result)
+                if others and self.persistent:
+                    await self._put_persistent(others, result)
+                return result
+        self.stats["miss"] += 1
+        return None
+
+    async def put(self, keys: list[str], result: ValidationResult):
+        # 마감 시간 때문에 일부만 검사한 결과는 재사용하지 않는다
+        if result.is_partial or not keys:
+            return
+        for key in keys:
+            self._put_memory(key, result)
+        if self.persistent:
+            await self._put_persistent(keys, result)
+
+    def _get_memory(self, key: str) -> Optional[ValidationResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_sec:
+            del self._entries[key]
+            self.stats["expired"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def _put_memory(self, key: str, result: ValidationResult):
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evicted"] += 1
+
+    async def _get_persistent(self, key: str) -> Optional[ValidationResult]:
+        try:
+            async with AsyncSessionLocal() as session:
+                row = await session.get(ValidationResultCache, key)
+        except Exception as e:
+            logging.warning(f"⚠️ 결과 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+        created_time = row.created_time
+        if created_time.tzinfo is None:
+            created_time = created_time.replace(tzinfo=timezone.utc)
+        if datetime.now(timezone.utc) - created_time > timedelta(seconds=self.ttl_sec):
+            return None
+        return msgspec.json.decode(row.result, type=ValidationResult)
+
+    async def _put_persistent(self, keys, result: ValidationResult):
+        encoded = msgspec.json.encode(result)
+        now = datetime.now(timezone.utc)
+        try:
+            async with WriterSessionLocal() as session:
+                for key in keys:
+                    await session.merge(
+                        ValidationResultCache(key=key, result=encoded, created_time=now)
+                    )
+                await session.commit()
+        except Exception as e:
+            logging.warning(f"⚠️ 결과 캐시 저장 실패: {e}")
+
+    async def purge_expired(self) -> int:
+        """TTL 이 지난 DB 항목 삭제 (메모리 항목은 조회 시 제거된다)"""
+        if not self.persistent:
+            return 0
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_sec)
+        async with WriterSessionLocal() as session:
+            deleted = await session.execute(
+                delete(ValidationResultCache).where(
+                    ValidationResultCache.created_time < cutoff
+                )
+            )
+            await session.commit()
+        return deleted.rowcount
+
+    def snapshot(self) -> dict[str, int]:
+        return {"entries": len(self._entries), **self.stats}
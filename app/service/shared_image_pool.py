@@ -0,0 +1,122 @@
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+# POSIX 공유 메모리가 만들어지는 곳 (Linux), 컨테이너 기본 크기는 64MB
+SHM_PATH = "/dev/shm"
+# 다른 프로세스도 쓰므로 남은 공간의 이 비율까지만 슬롯에 쓴다
+SHM_USABLE_RATIO = 0.5
+
+
+def available_shared_memory() -> Optional[int]:
+    """/dev/shm 의 남은 바이트 (확인할 수 없는 OS 면 None)"""
+    try:
+        stat = os.statvfs(SHM_PATH)
+    except (AttributeError, OSError):
+        return None
+    return stat.f_bavail * stat.f_frsize
+
+
+@dataclass(frozen=True)
+class SharedImageDescriptor:
+    # 프로세스 경계를 넘는 것은 이 디스크립터뿐, 픽셀은 공유 메모리에 있다
+    segment_name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedImageSlot:
+    def __init__(self, segment: shared_memory.SharedMemory):
+        self.segment = segment
+
+    @property
+    def nbytes(self) -> int:
+        return self.segment.size
+
+    def write(self, image: np.ndarray) -> SharedImageDescriptor:
+        view = np.ndarray(image.shape, dtype=image.dtype, buffer=self.segment.buf)
+        np.copyto(view, image)
+        del view
+        return SharedImageDescriptor(
+            segment_name=self.segment.name,
+            shape=tuple(image.shape),
+            dtype=image.dtype.str,
+        )
+
+
+class SharedImagePool:
+    """
+    미리 할당한 공유 메모리 세그먼트 묶음.
+    검증 요청마다 슬롯을 빌려 이미지를 쓰고, 결과가 돌아오면 슬롯을 반납한다.
+
+    세그먼트는 쓰는 순간 페이지가 잡히므로 슬롯 수 x 크기가 /dev/shm 에 들어가도록
+    start() 에서 슬롯 수를 줄이고 (넘치면 쓰기 중 SIGBUS), 최근 반납한 슬롯부터
+    다시 빌려주어 (LIFO) 실제로 건드리는 슬롯을 동시에 쓰는 만큼으로 유지한다.
+    """
+
+    def __init__(self, slot_count: int, slot_bytes: int):
+        self.slot_count = slot_count
+        self.slot_bytes = slot_bytes
+
+        self._slots: list[SharedImageSlot] = []
+        self._free: deque[SharedImageSlot] = deque()
+
+    def start(self) -> bool:
+        """슬롯을 만든다. /dev/shm 에 슬롯 하나도 들어가지 않으면 False"""
+        available = available_shared_memory()
+        if available is not None:
+            capacity = int(available * SHM_USABLE_RATIO) // self.slot_bytes
+            if capacity < self.slot_count:
+                logging.warning(
+                    f"⚠️ /dev/shm 여유 {available // (1024 * 1024)}MB 에 맞춰 공유 메모리 슬롯을 "
+                    f"{self.slot_count}개에서 {capacity}개로 줄입니다"
+                )
+                self.slot_count = capacity
+        if self.slot_count <= 0:
+            return False
+
+        for _ in range(self.slot_count):
+            slot = SharedImageSlot(
+                shared_memory.SharedMemory(create=True, size=self.slot_bytes)
+            )
+            self._slots.append(slot)
+            self._free.append(slot)
+        logging.info(
+            f"✅ 공유 메모리 풀 생성: {self.slot_count}개 x {self.slot_bytes // (1024 * 1024)}MB"
+        )
+        return True
+
+    def fits(self, image: np.ndarray) -> bool:
+        return image.nbytes <= self.slot_bytes
+
+    def acquire(self) -> Optional[SharedImageSlot]:
+        """빈 슬롯이 없으면 None (호출자는 pickle 로 넘긴다)"""
+        return self._free.pop() if self._free else None
+
+    def release(self, slot: SharedImageSlot):
+        self._free.append(slot)
+
+    def close(self):
+        for slot in self._slots:
+            slot.segment.close()
+            slot.segment.unlink()
+        self._slots.clear()
+
+
+# 워커 프로세스 쪽: 세그먼트 이름별로 한 번만 attach 해서 재사용
+_attached_segments: dict[str, shared_memory.SharedMemory] = {}
+
+
+def open_shared_image(descriptor: SharedImageDescriptor) -> np.ndarray:
+    segment = _attached_segments.get(descriptor.segment_name)
+    if segment is None:
+        segment = shared_memory.SharedMemory(name=descriptor.segment_name)
+        _attached_segments[descriptor.segment_name] = segment
+    return np.ndarray(
+        descriptor.shape, dtype=np.dtype(descriptor.dtype), buffer=segment.buf
+    )
@@ -0,0 +1,125 @@
+import io
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# EXIF 회전은 적용하지 않고 (PIL 과 동일), 8bit gray 또는 BGR 로 디코딩
+DECODE_FLAGS = cv2.IMREAD_ANYCOLOR | cv2.IMREAD_IGNORE_ORIENTATION
+
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_IEND = b"IEND\xaeB`\x82"
+# 끝 마커를 찾을 파일 끝 범위 (카메라/스캐너 trailer, 덧붙인 메타데이터가 EOI 뒤에 올 수 있다)
+TAIL_WINDOW = 64 * 1024
+
+# libjpeg 의 DCT 스케일링을 쓰는 축소 디코딩 플래그 (JPEG 외 형식은 디코딩 후 축소)
+REDUCED_FLAGS = {
+    (1, False): cv2.IMREAD_COLOR,
+    (2, False): cv2.IMREAD_REDUCED_COLOR_2,
+    (4, False): cv2.IMREAD_REDUCED_COLOR_4,
+    (8, False): cv2.IMREAD_REDUCED_COLOR_8,
+    (1, True): cv2.IMREAD_GRAYSCALE,
+    (2, True): cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    (4, True): cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    (8, True): cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
+
+class ImageDecodeError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class DecodeOptions:
+    # 디코딩 결과 픽셀 수 상한, 0 이면 원본 해상도 컬러 (grayscale 도 적용하지 않는다)
+    pixel_budget: int = 0
+    # 검출기들이 요구하는 최소 픽셀 수 (축소 배율의 하한)
+    min_pixels: int = 0
+    grayscale: bool = False
+
+    @classmethod
+    def for_detectors(cls, detectors: list, pixel_budget: int = 0) -> "DecodeOptions":
+        return cls(
+            pixel_budget=pixel_budget,
+            min_pixels=max((d.min_pixels for d in detectors), default=0),
+            grayscale=not any(d.requires_color for d in detectors),
+        )
+
+    def choose_scale(self, width: int, height: int) -> int:
+        pixels = width * height
+        if self.pixel_budget <= 0 or pixels <= self.pixel_budget:
+            return 1
+        scale = 1
+        for candidate in (2, 4, 8):
+            if pixels // (candidate * candidate) < self.min_pixels:
+                break
+            scale = candidate
+            if pixels // (candidate * candidate) <= self.pixel_budget:
+                break
+        return scale
+
+    def flags(self, width: int, height: int) -> int:
+        scale = self.choose_scale(width, height)
+        if scale == 1 and not self.grayscale:
+            return DECODE_FLAGS
+        return REDUCED_FLAGS[(scale, self.grayscale)] | cv2.IMREAD_IGNORE_ORIENTATION
+
+
+def read_size(file_obj: io.BytesIO) -> Optional[tuple[int, int]]:
+    # PIL 은 open 시 헤더만 읽으므로 픽셀 디코딩 없이 크기를 알 수 있다
+    # PIL 이 읽지 못하는 형식이면 None (cv2 로는 디코딩될 수 있다)
+    file_obj.seek(0)
+    try:
+        with Image.open(file_obj) as image:
+            return image.size
+    except Exception as e:
+        logging.debug(f"이미지 헤더를 읽을 수 없어 원본 해상도로 디코딩합니다: {e}")
+        return None
+
+
+def check_truncated(buffer: np.ndarray) -> None:
+    # libjpeg 는 잘린 파일도 경고만 내고 회색으로 채워 디코딩하므로 끝 마커를 직접 확인
+    # (마커 뒤에 데이터가 더 있어도 정상 파일이므로 끝 범위 어디에든 있으면 통과)
+    head = buffer[:8].tobytes()
+    tail = buffer[-TAIL_WINDOW:].tobytes()
+    if head.startswith(JPEG_SOI) and tail.rfind(JPEG_EOI) < 0:
+        raise ImageDecodeError("JPEG 파일이 잘렸습니다 (EOI 마커 없음)")
+    if head.startswith(PNG_SIGNATURE) and tail.rfind(PNG_IEND) < 0:
+        raise ImageDecodeError("PNG 파일이 잘렸습니다 (IEND 청크 없음)")
+
+
+def decode_image(
+    file_obj: io.BytesIO, options: Optional[DecodeOptions] = None
+) -> np.ndarray:
+    """
+    다운로드 버퍼를 복사하지 않고 (memoryview) 한 번에 검증 + 디코딩한다.
+    options 에 픽셀 예산이 있으면 예산에 맞는 배율로 축소/grayscale 디코딩하고,
+    예산이 0 이거나 헤더를 읽지 못하면 원본 해상도 컬러로 디코딩한다.
+    손상되거나 잘린 파일이면 ImageDecodeError 를 낸다.
+    """
+    flags = DECODE_FLAGS
+    if options is not None and options.pixel_budget > 0:
+        size = read_size(file_obj)
+        if size is not None:
+            flags = options.flags(*size)
+
+    view = file_obj.getbuffer()
+    try:
+        buffer = np.frombuffer(view, dtype=np.uint8)
+        if buffer.size == 0:
+            raise ImageDecodeError("빈 파일입니다")
+        check_truncated(buffer)
+
+        image = cv2.imdecode(buffer, flags)
+        del buffer
+    finally:
+        view.release()
+
+    if image is None:
+        raise ImageDecodeError("지원하지 않는 형식이거나 손상된 이미지입니다")
+    return np.ascontiguousarray(image)
@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Literal, Optional
+
+import numpy as np
+
+from app.service.shared_image_pool import (
+    SharedImageDescriptor,
+    SharedImagePool,
+    open_shared_image,
+)
+from app.service.validation_result import ValidationResult
+from app.service.validation_service import (
+    DegradationPolicy,
+    DetectorStats,
+    ValidationService,
+)
+
+ExecutorMode = Literal["process", "thread", "inline"]
+
+# 워커 프로세스마다 한 번만 만들어지는 ValidationService
+_worker_service: Optional[ValidationService] = None
+
+
+def _init_worker(
+    detector_factory: Callable[[], list], degradation_policy: DegradationPolicy
+) -> None:
+    global _worker_service
+    _worker_service = ValidationService(detector_factory(), degradation_policy)
+
+
+def _warmup() -> int:
+    return os.getpid()
+
+
+def _validate_in_worker(
+    image: np.ndarray, deadline: Optional[float]
+) -> ValidationResult:
+    return _worker_service.validate(image, deadline)
+
+
+def _validate_batch_in_worker(
+    images: list[np.ndarray], deadline: Optional[float]
+) -> list[ValidationResult]:
+    return _worker_service.validate_batch(images, deadline)
+
+
+def _validate_shared_in_worker(
+    descriptor: SharedImageDescriptor, deadline: Optional[float]
+) -> ValidationResult:
+    image = open_shared_image(descriptor)
+    try:
+        return _worker_service.validate(image, deadline)
+    finally:
+        # 세그먼트 버퍼를 참조하는 뷰를 남기지 않는다
+        del image
+
+
+class ValidationExecutor:
+    """
+    ValidationService 를 이벤트 루프 밖에서 실행한다.
+
+    - process: ProcessPoolExecutor, 워커마다 detector 를 시작 시 한 번 생성
+    - thread: ThreadPoolExecutor, 하나의 ValidationService 를 공유
+    - inline: 이벤트 루프에서 직접 실행 (디버깅용)
+    """
+
+    def __init__(
+        self,
+        detector_factory: Callable[[], list],
+        mode: ExecutorMode = "process",
+        max_workers: int = 0,
+        shared_memory_slots: int = 0,
+        shared_memory_slot_mb: int = 0,
+        degradation_policy: DegradationPolicy = "skip",
+    ):
+        self.detector_factory = detector_factory
+        self.mode = mode
+        self.degradation_policy = degradation_policy
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # 슬롯 수 0 이면 워커당 2개 (워커가 검증하는 동안 다음 이미지를 쓸 수 있도록)
+        self.shared_memory_slots = shared_memory_slots or self.max_workers * 2
+        self.shared_memory_slot_mb = shared_memory_slot_mb
+
+        self._executor: Optional[Executor] = None
+        self._service: Optional[ValidationService] = None
+        self._shared_pool: Optional[SharedImagePool] = None
+
+        self.detector_stats = DetectorStats()
+
+    def start(self):
+        if self.mode == "process":
+            # fork 는 이벤트 루프/커넥션 스레드 상태를 복제하므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.detector_factory, self.degradation_policy),
+            )
+            # 워커를 미리 띄워 첫 메시지에서 detector 생성 비용을 내지 않도록 함
+            pids = {
+                f.result()
+                for f in [
+                    self._executor.submit(_warmup) for _ in range(self.max_workers)
+                ]
+            }
+            logging.info(f"✅ 검증 프로세스 풀 시작: 워커 {len(pids)}개")
+
+            # 이미지를 pickle 로 복사하지 않고 공유 메모리로 넘긴다 (0MB 면 사용 안 함)
+            if self.shared_memory_slot_mb > 0:
+                pool = SharedImagePool(
+                    slot_count=self.shared_memory_slots,
+                    slot_bytes=self.shared_memory_slot_mb * 1024 * 1024,
+                )
+                if pool.start():
+                    self._shared_pool = pool
+                else:
+                    logging.warning(
+                        "⚠️ /dev/shm 공간이 부족해 공유 메모리 없이 이미지를 복사해 넘깁니다"
+                    )
+        elif self.mode == "thread":
+            self._service = ValidationService(
+                self.detector_factory(), self.degradation_policy
+            )
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="validation"
+            )
+            logging.info(f"✅ 검증 스레드 풀 시작: 워커 {self.max_workers}개")
+        elif self.mode == "inline":
+            self._service = ValidationService(
+                self.detector_factory(), self.degradation_policy
+            )
+        else:
+            raise ValueError(f"지원하지 않는 executor 모드: {self.mode}")
+
+    async def validate(
+        self, image: np.ndarray, deadline: Optional[float] = None
+    ) -> ValidationResult:
+        result = await self._validate(image, deadline)
+        self.detector_stats.record(result)
+        return result
+
+    async def _validate(
+        self, image: np.ndarray, deadline: Optional[float]
+    ) -> ValidationResult:
+        if self.mode == "inline":
+            return self._service.validate(image, deadline)
+
+        loop = asyncio.get_running_loop()
+        if self.mode == "thread":
+            return await loop.run_in_executor(
+                self._executor, self._service.validate, image, deadline
+            )
+        slot = None
+        if self._shared_pool is not None and self._shared_pool.fits(image):
+            slot = self._shared_pool.acquire()
+        # 공유 메모리를 쓸 수 없으면 (큰 이미지, 빈 슬롯 없음) pickle 로 넘긴다
+        if slot is None:
+            return await loop.run_in_executor(
+                self._executor, _validate_in_worker, image, deadline
+            )
+
+        try:
+            descriptor = await asyncio.to_thread(slot.write, image)
+            return await loop.run_in_executor(
+                self._executor, _validate_shared_in_worker, descriptor, deadline
+            )
+        finally:
+            self._shared_pool.release(slot)
+
+    async def validate_batch(
+        self, images: list[np.ndarray], deadline: Optional[float] = None
+    ) -> list[ValidationResult | Exception]:
+        """
+        이미지들을 워커 수만큼의 묶음으로 나눠 묶음마다 validate_batch 로 검증한다.
+        묶음이 실패하면 그 묶음만 이미지 단위로 다시 검증해서 실패를 이미지별로 돌려준다.
+        """
+        if not images:
+            return []
+        chunk_count = 1 if self.mode == "inline" else min(self.max_workers, len(images))
+        chunk_size = -(-len(images) // chunk_count)
+        chunks = [
+            images[start : start + chunk_size]
+            for start in range(0, len(images), chunk_size)
+        ]
+        chunk_results = await asyncio.gather(
+            *(self._validate_batch(chunk, deadline) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        results = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, Exception):
+                chunk_result = await asyncio.gather(
+                    *(self._validate(image, deadline) for image in chunk),
+                    return_exceptions=True,
+                )
+            results.extend(chunk_result)
+        for result in results:
+            if isinstance(result, ValidationResult):
+                self.detector_stats.record(result)
+        return results
+
+    async def _validate_batch(
+        self, images: list[np.ndarray], deadline: Optional[float]
+    ) -> list[ValidationResult]:
+        if self.mode == "inline":
+            return self._service.validate_batch(images, deadline)
+
+        loop = asyncio.get_running_loop()
+        if self.mode == "thread":
+            return await loop.run_in_executor(
+                self._executor, self._service.validate_batch, images, deadline
+            )
+        # 묶음은 슬롯 여러 개를 동시에 잡아야 하므로 공유 메모리 대신 pickle 로 넘긴다
+        return await loop.run_in_executor(
+            self._executor, _validate_batch_in_worker, images, deadline
+        )
+
+    def shutdown(self):
+        logging.info(f"📊 검출기 실행 통계: {self.detector_stats.snapshot()}")
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logging.info("🔴 검증 executor 종료")
+        if self._shared_pool:
+            self._shared_pool.close()
+            self._shared_pool = None
@@ -1,7 +1,23 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
 @dataclass
 class ValidationResult:
     is_blank: Optional[bool] = None
+    is_folded: Optional[bool] = None
+    tilt_angle: Optional[float] = None
+
+    # 실행/건너뛴 검출기 이름 (통계용)
+    executed_detectors: list[str] = field(default_factory=list)
+    skipped_detectors: list[str] = field(default_factory=list)
+
+    # 마감 시간 때문에 생략했거나 낮은 해상도로 실행한 검출기가 있으면 부분 결과
+    is_partial: bool = False
+    deadline_skipped_detectors: list[str] = field(default_factory=list)
+    degraded_detectors: list[str] = field(default_factory=list)
+
+    # 이전 결과를 재사용한 경우: "cache" (같은 객체/내용), "near_duplicate" (유사 이미지),
+    # "single_flight" (동시에 처리 중이던 같은 객체), "replay" (저장까지 끝난 이벤트의 재전달)
+    reused_from: Optional[str] = None
+    near_duplicate_distance: Optional[int] = None
@@ -1,19 +1,182 @@
+import time
+from collections import Counter
+from typing import Literal, Optional
+
 import numpy as np
 
+from app.service.image_context import ImageContext
 from app.service.validation_result import ValidationResult
 
+# 마감 시간이 부족할 때: none = 그대로 실행, skip = 생략 가능한 검출기를 건너뜀,
+# coarse = 낮은 해상도 버전이 시간 안에 들어오면 그것을 실행하고 아니면 건너뜀
+DegradationPolicy = Literal["none", "skip", "coarse"]
+
 
 class ValidationService:
-    def __init__(self, detectors: list):
-        self.detectors = detectors
+    def __init__(self, detectors: list, degradation_policy: DegradationPolicy = "skip"):
+        self.detectors = self.plan(detectors)
+        self.degradation_policy = degradation_policy
+        self._coarse = {id(detector): detector.coarse() for detector in self.detectors}
+
+    @staticmethod
+    def plan(detectors: list) -> list:
+        """
+        skip_if 조건에 쓰이는 결과를 만드는 검출기가 먼저 실행되도록 정렬하고,
+        동시에 실행 가능한 검출기 중에서는 비용이 낮은 것부터 실행한다.
+        """
+        producers = {}
+        for detector in detectors:
+            for output in getattr(detector, "outputs", ()):
+                producers[output] = detector
+
+        dependencies = {}
+        for detector in detectors:
+            dependencies[id(detector)] = set()
+            for key in getattr(detector, "skip_if", {}):
+                if key not in producers:
+                    raise ValueError(
+                        f"{type(detector).__name__}: skip_if 의 '{key}' 를 만드는 검출기가 없습니다"
+                    )
+                if producers[key] is not detector:
+                    dependencies[id(detector)].add(id(producers[key]))
+
+        ordered = []
+        remaining = list(detectors)
+        while remaining:
+            done = {id(detector) for detector in ordered}
+            ready = [d for d in remaining if dependencies[id(d)] <= done]
+            if not ready:
+                names = [type(d).__name__ for d in remaining]
+                raise ValueError(f"검출기 의존 관계에 순환이 있습니다: {names}")
+            # 안정 정렬이므로 비용이 같으면 전달된 순서를 유지
+            next_detector = min(ready, key=lambda d: getattr(d, "cost", 1.0))
+            ordered.append(next_detector)
+            remaining.remove(next_detector)
+        return ordered
 
-    def validate(self, image):
+    def validate(self, image, deadline: Optional[float] = None):
+        """deadline: 결과가 의미 있는 마지막 시각 (time.time() 기준, None 이면 제한 없음)"""
         result = ValidationResult()
-        for detector in self.detectors:
-            output = detector.validate(image)
-            for k, v in output.items():
-                if hasattr(result, k):
-                    if isinstance(v, (np.bool_, np.bool)):
-                        v = bool(v)
-                    setattr(result, k, v)
+        # 검출기들이 gray/피라미드/엣지 등을 공유하도록 이미지 단위 컨텍스트를 넘긴다
+        context = ImageContext(image)
+        try:
+            for detector in self.detectors:
+                if self.should_skip(detector, result):
+                    result.skipped_detectors.append(detector.name)
+                    continue
+                runner = self.fit_deadline(detector, deadline, (result, context))
+                if runner is None:
+                    continue
+                self.merge(result, runner.validate(context))
+                result.executed_detectors.append(detector.name)
+        finally:
+            context.release()
         return result
+
+    def validate_batch(
+        self, images: list, deadline: Optional[float] = None
+    ) -> list[ValidationResult]:
+        """
+        validate 와 같은 결과를 검출기 단위로 모아서 계산한다.
+        검출기마다 건너뛰지 않은 이미지만 validate_batch 한 번으로 넘긴다.
+        deadline 은 배치 전체에 하나이며, 검출기 예산은 이미지 수만큼 곱해서 본다.
+        """
+        results = [ValidationResult() for _ in images]
+        contexts = [ImageContext(image) for image in images]
+        try:
+            for detector in self.detectors:
+                active = []
+                for result, context in zip(results, contexts):
+                    if self.should_skip(detector, result):
+                        result.skipped_detectors.append(detector.name)
+                    else:
+                        active.append((result, context))
+                if not active:
+                    continue
+                runner = self.fit_deadline(detector, deadline, *active)
+                if runner is None:
+                    continue
+                outputs = runner.validate_batch([context for _, context in active])
+                for (result, _), output in zip(active, outputs):
+                    self.merge(result, output)
+                    result.executed_detectors.append(detector.name)
+        finally:
+            for context in contexts:
+                context.release()
+        return results
+
+    def fit_deadline(
+        self,
+        detector,
+        deadline: Optional[float],
+        *active: tuple[ValidationResult, ImageContext],
+    ):
+        """
+        남은 시간 안에 실행할 검출기 (원본 또는 낮은 해상도 버전) 를 고르고,
+        시간이 부족하면 None 을 반환한다. 필수 검출기는 항상 원본을 실행한다.
+        (결과, 이미지) 마다 예산이 필요하며, 예산에는 아직 만들지 않은 축소 이미지의
+        생성 시간도 포함한다 (고해상도 원본일수록 커진다).
+        """
+        if (
+            deadline is None
+            or self.degradation_policy == "none"
+            or not getattr(detector, "optional", False)
+        ):
+            return detector
+
+        remaining_ms = (deadline - time.time()) * 1000
+        results = [result for result, _ in active]
+        contexts = [context for _, context in active]
+        if sum(detector.budget_for(context) for context in contexts) <= remaining_ms:
+            return detector
+
+        coarse = self._coarse.get(id(detector))
+        if (
+            self.degradation_policy == "coarse"
+            and coarse is not None
+            and sum(coarse.budget_for(context) for context in contexts) <= remaining_ms
+        ):
+            for result in results:
+                result.is_partial = True
+                result.degraded_detectors.append(detector.name)
+            return coarse
+
+        for result in results:
+            result.is_partial = True
+            result.skipped_detectors.append(detector.name)
+            result.deadline_skipped_detectors.append(detector.name)
+        return None
+
+    @staticmethod
+    def should_skip(detector, result: ValidationResult) -> bool:
+        return any(
+            getattr(result, key) == value
+            for key, value in getattr(detector, "skip_if", {}).items()
+        )
+
+    @staticmethod
+    def merge(result: ValidationResult, output: dict):
+        for k, v in output.items():
+            if hasattr(result, k):
+                if isinstance(v, (np.bool_, np.bool)):
+                    v = bool(v)
+                setattr(result, k, v)
+
+
+class DetectorStats:
+    """검출기별 실행/건너뜀 횟수 (워커 프로세스 결과를 메인 프로세스에서 집계)"""
+
+    def __init__(self):
+        self.executed = Counter()
+        self.skipped = Counter()
+
+    def record(self, result: ValidationResult):
+        self.executed.update(result.executed_detectors)
+        self.skipped.update(result.skipped_detectors)
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        names = sorted(set(self.executed) | set(self.skipped))
+        return {
+            name: {"executed": self.executed[name], "skipped": self.skipped[name]}
+            for name in names
+        }
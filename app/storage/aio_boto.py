@@ -1,11 +1,15 @@
 import io
 import os
+from typing import Optional
+
 import aioboto3
 from app.config.custom_logger import time_logger
 from app.config.env_config import get_settings
 
 config = get_settings()
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class AioBoto:
     def __init__(self):
@@ -31,11 +35,30 @@ class AioBoto:
 
     @time_logger
     async def download_image_with_client(
-        self, bucket_name: str, key: str, file_obj: io.BytesIO
+        self,
+        bucket_name: str,
+        key: str,
+        file_obj: io.BytesIO,
+        etag: Optional[str] = None,
     ):
-        await self.s3_client.download_fileobj(
-            Bucket=bucket_name, Key=key, Fileobj=file_obj
+        if etag is None:
+            await self.s3_client.download_fileobj(
+                Bucket=bucket_name, Key=key, Fileobj=file_obj
+            )
+            return
+        # 이미 HEAD 로 ETag 를 받았으므로 download_fileobj (내부에서 HEAD 를 다시 보냄) 대신
+        # GET 한 번으로 받는다. 그 사이 객체가 바뀌면 412 로 실패한다 (HEAD 결과와 내용 일치 보장)
+        response = await self.s3_client.get_object(
+            Bucket=bucket_name, Key=key, IfMatch=f'"{etag}"'
         )
+        async with response["Body"] as stream:
+            while chunk := await stream.read(DOWNLOAD_CHUNK_SIZE):
+                file_obj.write(chunk)
+
+    async def head_object_etag(self, bucket_name: str, key: str) -> Optional[str]:
+        response = await self.s3_client.head_object(Bucket=bucket_name, Key=key)
+        etag = response.get("ETag")
+        return etag.strip('"') if etag else None
 
     async def close(self):
         if self.s3_client_cm:
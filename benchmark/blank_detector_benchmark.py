@@ -0,0 +1,69 @@
+"""
+BlankDetector 이전 구현 (gray → bool 배열 → np.mean) 과
+재사용 버퍼 구현 (전체 스캔 / 샘플 + 블록 조기 종료) 비교
+
+    python -m benchmark.blank_detector_benchmark
+"""
+
+import time
+
+import numpy as np
+
+from app.service.detector.blank_detector import BlankDetector
+from app.service.utils.gray_filter import gray_filter_np
+
+
+def legacy_is_blank(image, bin_threshold=150, blank_threshold_ratio=0.99999):
+    gray_image = gray_filter_np(image)
+    binary_image = gray_image > bin_threshold
+    return np.mean(binary_image) >= blank_threshold_ratio
+
+
+def make_images(width: int, height: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    blank = np.full((height, width, 3), 250, dtype=np.uint8)
+    almost_blank = blank.copy()
+    # 허용치 경계 근처의 어두운 점
+    dark = int(width * height * (1 - 0.99999))
+    almost_blank.reshape(-1, 3)[rng.choice(width * height, dark, replace=False)] = 0
+    text = blank.copy()
+    text[height // 4 : height // 2, width // 8 : -width // 8] = rng.integers(
+        0, 255, (height // 4, width - width // 4, 3), dtype=np.uint8
+    )
+    return {
+        "blank color": blank,
+        "almost blank color": almost_blank,
+        "text color": text,
+        "text gray": gray_filter_np(text),
+    }
+
+
+def best_time(func, image, repeat: int = 10) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(image)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    full_scan = BlankDetector(early_exit=False)
+    early_exit = BlankDetector(early_exit=True)
+    for width, height in [(2480, 3508), (4960, 7016)]:
+        print(f"{width}x{height}")
+        for name, image in make_images(width, height).items():
+            expected = legacy_is_blank(image)
+            assert full_scan.is_blank_image(image) == expected, name
+            assert early_exit.is_blank_image(image) == expected, name
+            legacy = best_time(legacy_is_blank, image)
+            fused = best_time(full_scan.is_blank_image, image)
+            early = best_time(early_exit.is_blank_image, image)
+            print(
+                f"  {name:<20} legacy {legacy * 1000:7.2f} ms  "
+                f"fused {fused * 1000:7.2f} ms  early exit {early * 1000:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
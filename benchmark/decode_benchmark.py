@@ -0,0 +1,62 @@
+"""
+원본 해상도 컬러 디코딩 vs 픽셀 예산 기반 축소 grayscale 디코딩 비교
+
+    python -m benchmark.decode_benchmark
+"""
+
+import io
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from app.service.utils.image_decoder import DecodeOptions, decode_image
+
+# A4 스캔 크기 (DPI: (width, height))
+A4_SCANS = {300: (2480, 3508), 600: (4960, 7016)}
+
+
+def make_scan(width: int, height: int) -> bytes:
+    rng = np.random.default_rng(0)
+    page = np.full((height, width, 3), 245, dtype=np.uint8)
+    # 글자 줄을 흉내낸 어두운 가로 띠
+    for y in range(height // 10, height - height // 10, max(height // 60, 1)):
+        page[y : y + max(height // 300, 1), width // 10 : width - width // 10] = 40
+    page = cv2.add(page, rng.integers(0, 8, page.shape, dtype=np.uint8))
+    ok, encoded = cv2.imencode(".jpg", page, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    assert ok
+    return encoded.tobytes()
+
+
+def measure(data: bytes, options, repeat: int = 5) -> tuple[float, int, tuple]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        image = decode_image(io.BytesIO(data), options)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    image = decode_image(io.BytesIO(data), options)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, image.shape
+
+
+def main():
+    cases = {
+        "full color": None,
+        "budget 2MP gray": DecodeOptions(pixel_budget=2_000_000, grayscale=True),
+        "budget 0.5MP gray": DecodeOptions(pixel_budget=500_000, grayscale=True),
+    }
+    for dpi, (width, height) in A4_SCANS.items():
+        data = make_scan(width, height)
+        print(f"A4 {dpi}DPI ({width}x{height}, {len(data) / 1e6:.1f}MB JPEG)")
+        for name, options in cases.items():
+            elapsed, peak, shape = measure(data, options)
+            print(
+                f"  {name:<18} {elapsed * 1000:8.1f} ms  peak {peak / 1e6:7.1f} MB  {shape}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+FoldDetector 해상도별 실행 시간 / 검출 결과 (합성 A4 페이지)
+
+    python -m benchmark.fold_detector_benchmark
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+from app.service.detector.fold_detector import FoldDetector
+from app.service.image_context import ImageContext
+
+A4_MM = (210, 297)
+DPIS = (150, 300, 600)
+
+
+def mm(dpi: int, value: float) -> int:
+    return max(int(round(value / 25.4 * dpi)), 1)
+
+
+def make_page(dpi: int, fold: str = None, table: bool = False, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    width, height = mm(dpi, A4_MM[0]), mm(dpi, A4_MM[1])
+    page = np.full((height, width), 235, dtype=np.uint8)
+
+    # 본문: 여백 20mm, 줄 간격 6mm, 글자 높이 2.5mm 의 단어 블록
+    for y in range(mm(dpi, 20), height - mm(dpi, 20), mm(dpi, 6)):
+        x = mm(dpi, 20)
+        while x < width - mm(dpi, 20):
+            word = int(rng.integers(mm(dpi, 4), mm(dpi, 15)))
+            cv2.rectangle(page, (x, y), (x + word, y + mm(dpi, 2.5)), 30, -1)
+            x += word + mm(dpi, 2)
+    if table:
+        cv2.rectangle(
+            page, (mm(dpi, 25), height // 3), (width - mm(dpi, 25), height // 2), 0, 3
+        )
+
+    # 접힌 자국: 1mm 어두운 선 + 양쪽 3mm 그림자
+    shade, core = mm(dpi, 3), mm(dpi, 1)
+    if fold == "horizontal":
+        y = height // 2
+        page[y - shade : y + shade] = np.minimum(page[y - shade : y + shade], 205)
+        page[y : y + core] = 150
+    elif fold == "vertical":
+        x = width // 2
+        page[:, x - shade : x + shade] = np.minimum(page[:, x - shade : x + shade], 205)
+        page[:, x : x + core] = 150
+    elif fold == "diagonal":
+        start, end = (0, height // 5), (width, height // 3)
+        cv2.line(page, start, end, 205, shade * 2)
+        cv2.line(page, start, end, 150, core)
+
+    return cv2.add(page, rng.integers(0, 10, page.shape, dtype=np.uint8))
+
+
+def main(repeat: int = 5):
+    detector = FoldDetector()
+    cases = {
+        "no fold": dict(),
+        "table": dict(table=True),
+        "horizontal": dict(fold="horizontal"),
+        "vertical": dict(fold="vertical"),
+        "diagonal": dict(fold="diagonal"),
+    }
+    for dpi in DPIS:
+        print(f"A4 {dpi}DPI")
+        for name, kwargs in cases.items():
+            # 스캔은 컬러로 들어오므로 축소 + gray 변환 비용까지 포함해 잰다
+            page = cv2.cvtColor(make_page(dpi, **kwargs), cv2.COLOR_GRAY2BGR)
+            context = ImageContext(page)
+            budget = detector.budget_for(context)
+            # 축소/엣지는 검출기 간 공유 비용이므로 따로 잰다
+            start = time.perf_counter()
+            context.edges(
+                detector.pixel_budget, detector.canny_low, detector.canny_high
+            )
+            shared = time.perf_counter() - start
+
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = detector.validate(context)
+                best = min(best, time.perf_counter() - start)
+            print(
+                f"  {name:<12} is_folded={result['is_folded']!s:<5} "
+                f"detect {best * 1000:6.1f} ms  downscale+edges {shared * 1000:6.1f} ms  "
+                f"budget {budget:6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
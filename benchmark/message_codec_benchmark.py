@@ -0,0 +1,100 @@
+"""
+메시지 디코딩/인코딩 마이크로 벤치마크: json + dataclass vs msgspec
+
+    python -m benchmark.message_codec_benchmark
+"""
+
+import json
+import timeit
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+
+from app.message_queue.consume_message import parse_message
+from app.message_queue.publish_message import (
+    PublishMessageBody,
+    PublishMessageHeader,
+    ValidationServiceData,
+    encode_body,
+    header_to_dict,
+)
+
+BODY = json.dumps(
+    {
+        "gid": "0195a5c3-8b1e-7c2a-9f4e-3d2b1a0c9e8f",
+        "bucket": "original-images",
+        "original_object_key": "2025/03/15/0195a5c3-8b1e-7c2a-9f4e-3d2b1a0c9e8f.jpg",
+    }
+).encode()
+HEADERS = {
+    "event_id": "0195a5c3-8b1e-7c2a-9f4e-000000000001",
+    "event_type": "image.validation.requested",
+    "trace_id": "0195a5c3-8b1e-7c2a-9f4e-000000000002",
+    "timestamp": "2025-03-15T20:52:45.314754+00:00",
+    "source_service": "image-upload-api",
+}
+
+
+# 이전 구현 (dataclass + json)
+@dataclass
+class LegacyHeader:
+    event_id: str
+    event_type: str
+    trace_id: str
+    timestamp: str
+    source_service: str
+
+
+@dataclass
+class LegacyPayload:
+    gid: str
+    bucket: str
+    original_object_key: str
+
+
+@dataclass
+class LegacyData:
+    is_blank: bool
+
+
+@dataclass
+class LegacyBody:
+    gid: str
+    status: str
+    completed_at: str
+    payload: LegacyData
+
+
+def legacy_parse(message):
+    payload = LegacyPayload(**json.loads(message.body.decode()))
+    header = LegacyHeader(**message.headers)
+    return header, payload
+
+
+def legacy_encode(body, header):
+    return json.dumps(asdict(body)).encode("utf-8"), asdict(header)
+
+
+def main(number: int = 200_000):
+    message = SimpleNamespace(body=BODY, headers=HEADERS)
+    header_args = dict(HEADERS, event_type="image.validation.result")
+
+    legacy_body = LegacyBody("gid", "success", "2025-03-15T20:52:45", LegacyData(True))
+    legacy_header = LegacyHeader(**header_args)
+    body = PublishMessageBody(
+        "gid", "success", "2025-03-15T20:52:45", ValidationServiceData(True)
+    )
+    header = PublishMessageHeader(**header_args)
+
+    cases = {
+        "decode legacy": lambda: legacy_parse(message),
+        "decode msgspec": lambda: parse_message(message),
+        "encode legacy": lambda: legacy_encode(legacy_body, legacy_header),
+        "encode msgspec": lambda: (encode_body(body), header_to_dict(header)),
+    }
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        print(f"{name:<16} {elapsed / number * 1e6:8.3f} us/msg")
+
+
+if __name__ == "__main__":
+    main()
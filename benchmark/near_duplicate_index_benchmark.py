@@ -0,0 +1,130 @@
+"""
+NearDuplicateIndex 조회 시간 (100만 항목) 과 재스캔/다른 페이지의 dHash 거리
+
+    python -m benchmark.near_duplicate_index_benchmark
+"""
+
+import time
+from itertools import combinations
+
+import cv2
+import numpy as np
+
+from app.service.near_duplicate_index import NearDuplicateIndex, dhash
+from app.service.validation_result import ValidationResult
+from benchmark.fold_detector_benchmark import A4_MM, make_page, mm
+from benchmark.tilt_detector_benchmark import rotate
+
+ENTRIES = 1_000_000
+QUERIES = 10_000
+MAX_DISTANCES = (3, 6)
+
+
+def flip_bits(rng, value: int, count: int) -> int:
+    for bit in rng.choice(64, count, replace=False):
+        value ^= 1 << int(bit)
+    return value
+
+
+def index_benchmark(max_distance: int):
+    rng = np.random.default_rng(0)
+    # 절반은 무작위, 절반은 비슷한 페이지가 많은 경우를 흉내 낸 군집 (기준 해시 주변)
+    random_hashes = rng.integers(0, 2**64, ENTRIES // 2, dtype=np.uint64)
+    bases = rng.integers(0, 2**64, 1000, dtype=np.uint64)
+    values = [int(v) for v in random_hashes]
+    values += [
+        flip_bits(rng, int(bases[i % len(bases)]), rng.integers(0, 8))
+        for i in range(ENTRIES // 2)
+    ]
+
+    index = NearDuplicateIndex(max_distance=max_distance, max_entries=ENTRIES)
+    result = ValidationResult(is_blank=False)
+    start = time.perf_counter()
+    for value in values:
+        index.add(value, result)
+    insert = (time.perf_counter() - start) / len(values)
+
+    queries = {
+        "near (random)": [
+            flip_bits(rng, values[i], max_distance)
+            for i in rng.integers(0, ENTRIES // 2, QUERIES)
+        ],
+        "near (cluster)": [
+            flip_bits(rng, values[i], max_distance)
+            for i in rng.integers(ENTRIES // 2, ENTRIES, QUERIES)
+        ],
+        "miss": [int(v) for v in rng.integers(0, 2**64, QUERIES, dtype=np.uint64)],
+    }
+    print(
+        f"max_distance={max_distance}, {len(index)} entries, {index.chunks} chunks, "
+        f"insert {insert * 1e6:.1f} us/entry"
+    )
+    for name, batch in queries.items():
+        elapsed, found = [], 0
+        for value in batch:
+            start = time.perf_counter()
+            found += index.lookup(value) is not None
+            elapsed.append(time.perf_counter() - start)
+        print(
+            f"  {name:<15} found {found / len(batch):6.1%}  "
+            f"p50 {np.percentile(elapsed, 50) * 1e6:7.1f} us  "
+            f"p99 {np.percentile(elapsed, 99) * 1e6:7.1f} us"
+        )
+
+
+def shaded_blank_page(seed: int = 0):
+    """조명이 고르지 않은 빈 페이지 (밝기 표준편차가 커서 색인 대상이 된다)"""
+    rng = np.random.default_rng(seed)
+    width, height = mm(300, A4_MM[0]), mm(300, A4_MM[1])
+    y = np.linspace(0, 1, height)[:, None]
+    x = np.linspace(0, 1, width)[None, :]
+    page = (190 + 50 * x * y + 15 * np.sin(3 * x)).astype(np.uint8)
+    return cv2.add(page, rng.integers(0, 10, page.shape, dtype=np.uint8))
+
+
+def rescan_distances():
+    page = make_page(300)
+    base = dhash(page)
+    rng = np.random.default_rng(1)
+    _, jpeg = cv2.imencode(".jpg", page, [cv2.IMWRITE_JPEG_QUALITY, 70])
+    variants = {
+        "jpeg q70": cv2.imdecode(jpeg, cv2.IMREAD_GRAYSCALE),
+        "noise": cv2.add(page, rng.integers(0, 12, page.shape, dtype=np.uint8)),
+        "brighter": cv2.add(page, 10),
+        "rotated 0.5deg": rotate(page, 0.5),
+        "rotated 2deg": rotate(page, 2.0),
+        "half size": cv2.resize(page, None, fx=0.5, fy=0.5),
+        # 같은 본문에 표/접힌 자국만 다른 페이지는 거리 안에 들어오므로
+        # 유사 이미지 결과는 빈 페이지 판정만 재사용한다
+        "same text + table": make_page(300, table=True),
+        "same text + fold": make_page(300, fold="horizontal"),
+    }
+    start = time.perf_counter()
+    dhash(page)
+    print(f"dHash A4 300DPI gray: {(time.perf_counter() - start) * 1000:.2f} ms")
+    for name, image in variants.items():
+        print(f"  {name:<20} distance {(dhash(image) ^ base).bit_count():2d}")
+
+    blank = shaded_blank_page(0)
+    rescan = shaded_blank_page(1)
+    distance = (dhash(blank) ^ dhash(rescan)).bit_count()
+    print(f"  {'shaded blank rescan':<20} distance {distance:2d}")
+    assert distance <= min(
+        MAX_DISTANCES
+    ), "빈 페이지 재스캔이 거리 안에 들어와야 합니다"
+
+    # 본문이 다른 페이지는 어떤 설정 거리보다도 멀어야 한다
+    hashes = [dhash(make_page(300, seed=seed)) for seed in range(12)]
+    distances = [(a ^ b).bit_count() for a, b in combinations(hashes, 2)]
+    print(f"  {'other pages (min)':<20} distance {min(distances):2d}")
+    assert min(distances) > max(MAX_DISTANCES), "다른 페이지가 거리 안에 들어왔습니다"
+
+
+def main():
+    rescan_distances()
+    for max_distance in MAX_DISTANCES:
+        index_benchmark(max_distance)
+
+
+if __name__ == "__main__":
+    main()
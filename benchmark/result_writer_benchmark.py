@@ -0,0 +1,94 @@
+"""
+결과 행 저장 처리량: 메시지마다 세션/커밋 vs ResultWriter (모아서 multi-row INSERT)
+
+    python -m benchmark.result_writer_benchmark
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmark.result_writer_benchmark
+
+기본은 임시 SQLite 파일, 테이블은 매 실행마다 다시 만든다.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.models import Base, ImageValidationResult
+from app.db.result_writer import ResultWriter
+
+ROWS = 3000
+CONCURRENCY = [8, 32, 128]
+
+
+def make_row() -> dict:
+    now = datetime.now(timezone.utc)
+    return dict(
+        gid=uuid.uuid4(),
+        event_id=str(uuid.uuid4()),
+        is_blank=False,
+        is_folded=False,
+        tilt_angle=0.0,
+        message_received_time=now,
+        file_received_time=now,
+        created_time=now,
+    )
+
+
+async def per_row(session_factory, row: dict):
+    # 기존 방식: 메시지마다 세션을 열고 한 행을 커밋
+    async with session_factory() as session:
+        session.add(ImageValidationResult(**row))
+        await session.commit()
+
+
+async def run(name: str, write, concurrency: int):
+    queue = asyncio.Queue()
+    for _ in range(ROWS):
+        queue.put_nowait(make_row())
+    latencies = []
+
+    async def worker():
+        while not queue.empty():
+            row = queue.get_nowait()
+            start = time.perf_counter()
+            await write(row)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {name:<14} concurrency {concurrency:>3}: {ROWS / elapsed:8.0f} rows/s  "
+        f"p50 {np.percentile(latencies, 50) * 1000:6.2f} ms  "
+        f"p99 {np.percentile(latencies, 99) * 1000:6.2f} ms"
+    )
+
+
+async def main():
+    url = os.getenv("BENCH_DATABASE_URL")
+    if url is None:
+        directory = tempfile.mkdtemp()
+        url = f"sqlite+aiosqlite:///{directory}/bench.db"
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    print(f"{url}, {ROWS} rows")
+
+    for concurrency in CONCURRENCY:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        await run("per-row", lambda row: per_row(session_factory, row), concurrency)
+
+        writer = ResultWriter(session_factory, max_batch_rows=100, flush_interval_ms=20)
+        writer.start()
+        await run("result writer", lambda row: writer.write([row]), concurrency)
+        await writer.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
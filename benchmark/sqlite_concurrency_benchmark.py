@@ -0,0 +1,111 @@
+"""
+SQLite 동시 쓰기: 기본 엔진 (rollback journal, 연결 풀) vs WAL + PRAGMA + 단일 writer 연결
+
+    python -m benchmark.sqlite_concurrency_benchmark
+
+워커 프로세스 PROCESSES 개가 각각 TASKS 개의 코루틴으로 "event_id 조회 → 결과 행 저장" 을
+ITERATIONS 번 반복한다. "database is locked" 오류 수와 처리량을 비교한다.
+"""
+
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import create_database_engine
+from app.db.models import Base, ImageValidationResult
+from app.db.result_writer import ResultWriter
+from benchmark.result_writer_benchmark import make_row
+
+PROCESSES = 4
+TASKS = [16, 64, 256]
+ITERATIONS = 20
+MODES = ["default", "wal + writer", "wal + writer + batch"]
+
+
+async def worker(mode: str, url: str, tasks: int) -> tuple[int, int, float]:
+    if mode == "default":
+        reader_engine = writer_engine = create_async_engine(url)
+    else:
+        reader_engine = create_database_engine(url)
+        writer_engine = create_database_engine(url, writer=True)
+    reader = async_sessionmaker(bind=reader_engine, expire_on_commit=False)
+    writer = async_sessionmaker(bind=writer_engine, expire_on_commit=False)
+    result_writer = None
+    if mode.endswith("batch"):
+        result_writer = ResultWriter(writer, max_batch_rows=100, flush_interval_ms=20)
+        result_writer.start()
+
+    async def write(row: dict):
+        if result_writer is not None:
+            await result_writer.write([row])
+            return
+        async with writer() as session:
+            session.add(ImageValidationResult(**row))
+            await session.commit()
+
+    written, locked = 0, 0
+
+    async def task():
+        nonlocal written, locked
+        for _ in range(ITERATIONS):
+            row = make_row()
+            try:
+                async with reader() as session:
+                    await session.scalar(
+                        select(ImageValidationResult.id).where(
+                            ImageValidationResult.event_id == row["event_id"]
+                        )
+                    )
+                await write(row)
+                written += 1
+            except Exception as e:
+                if "database is locked" not in str(e):
+                    raise
+                locked += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(task() for _ in range(tasks)))
+    elapsed = time.perf_counter() - start
+    if result_writer is not None:
+        await result_writer.close()
+    await reader_engine.dispose()
+    await writer_engine.dispose()
+    return written, locked, elapsed
+
+
+def run_worker(mode: str, url: str, tasks: int) -> tuple[int, int, float]:
+    return asyncio.run(worker(mode, url, tasks))
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    print(f"{PROCESSES} processes, {ITERATIONS} iterations per task")
+    for tasks in TASKS:
+        for index, mode in enumerate(MODES):
+            path = f"{directory}/bench_{tasks}_{index}.db"
+            Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+            url = f"sqlite+aiosqlite:///{path}"
+            with ProcessPoolExecutor(PROCESSES) as executor:
+                results = list(
+                    executor.map(
+                        run_worker,
+                        [mode] * PROCESSES,
+                        [url] * PROCESSES,
+                        [tasks] * PROCESSES,
+                    )
+                )
+            written = sum(result[0] for result in results)
+            locked = sum(result[1] for result in results)
+            elapsed = max(result[2] for result in results)
+            print(
+                f"  tasks/process {tasks:>3}  {mode:<20} "
+                f"{written / elapsed:7.0f} rows/s  locked errors {locked:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+TiltDetector 각도 오차 / 실행 시간 (합성 회전 A4 페이지)
+
+    python -m benchmark.tilt_detector_benchmark
+"""
+
+import time
+
+import cv2
+import numpy as np
+from deskew import determine_skew
+
+from app.service.detector.tilt_detector import TiltDetector
+from app.service.image_context import ImageContext
+from benchmark.fold_detector_benchmark import make_page
+
+ANGLES = (-12.0, -7.3, -3.0, -1.2, -0.4, 0.0, 0.27, 0.9, 2.5, 5.0, 11.1)
+DPIS = (150, 300, 600)
+
+
+def rotate(page: np.ndarray, angle: float) -> np.ndarray:
+    # cv2 는 반시계 방향이 양수, 바깥은 종이 색으로 채운다
+    height, width = page.shape
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+    return cv2.warpAffine(page, matrix, (width, height), borderValue=235)
+
+
+def run(detector: TiltDetector, dpi: int) -> tuple[list[float], list[float]]:
+    base = make_page(dpi)
+    errors, elapsed = [], []
+    for angle in ANGLES:
+        context = ImageContext(rotate(base, angle))
+        start = time.perf_counter()
+        estimated = detector.validate(context)["tilt_angle"]
+        elapsed.append(time.perf_counter() - start)
+        # 반시계로 angle 만큼 기운 페이지는 -angle 만큼 돌려야 바로 선다
+        errors.append(abs(estimated + angle) if estimated is not None else np.inf)
+    return errors, elapsed
+
+
+def main():
+    detectors = {
+        "coarse only": TiltDetector(refine=False),
+        "coarse + refine": TiltDetector(refine=True),
+    }
+    for dpi in DPIS:
+        print(f"A4 {dpi}DPI, {len(ANGLES)} angles")
+        for name, detector in detectors.items():
+            errors, elapsed = run(detector, dpi)
+            print(
+                f"  {name:<16} error mean {np.mean(errors):.3f} max {np.max(errors):.3f} deg  "
+                f"time median {np.median(elapsed) * 1000:6.1f} ms (pyramid included)"
+            )
+
+    # 비교용: 원본 해상도에 바로 determine_skew (한 장만)
+    page = rotate(make_page(150), 2.5)
+    start = time.perf_counter()
+    angle = determine_skew(page, min_angle=-15, max_angle=15)
+    print(
+        f"raw determine_skew A4 150DPI: {angle:.2f} deg (truth -2.5), "
+        f"{(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
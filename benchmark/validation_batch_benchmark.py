@@ -0,0 +1,56 @@
+"""
+ValidationService.validate (이미지마다) 와 validate_batch (검출기 단위 묶음) 비교
+
+    python -m benchmark.validation_batch_benchmark
+"""
+
+import time
+
+from app.service.detector.blank_detector import BlankDetector
+from app.service.validation_service import ValidationService
+from benchmark.blank_detector_benchmark import make_images
+
+
+def make_batch(width: int, height: int, size: int, ragged: bool) -> list:
+    # blank 가 대부분이고 일부는 경계 근처/본문이 있는 gray 이미지
+    samples = [
+        image if image.ndim == 2 else image[..., 0].copy()
+        for image in make_images(width, height).values()
+    ]
+    images = []
+    for index in range(size):
+        image = samples[index % len(samples)] if index % 4 == 0 else samples[0]
+        if ragged:
+            image = image[: height - index % 3, : width - index % 5]
+        images.append(image)
+    return images
+
+
+def best_time(func, images, repeat: int = 10) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(images)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    service = ValidationService([BlankDetector()])
+    for width, height in [(128, 181), (512, 724), (2480, 3508)]:
+        for size, ragged in [(8, False), (32, False), (32, True)]:
+            images = make_batch(width, height, size, ragged)
+            single = [service.validate(image).is_blank for image in images]
+            batched = [result.is_blank for result in service.validate_batch(images)]
+            assert single == batched
+
+            loop = best_time(lambda xs: [service.validate(x) for x in xs], images)
+            batch = best_time(service.validate_batch, images)
+            print(
+                f"{width}x{height} x{size:<3}{' ragged' if ragged else '       '} per image {loop * 1000:7.2f} ms  "
+                f"batch {batch * 1000:7.2f} ms  ({loop / batch:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()